@@ -0,0 +1,93 @@
+"""
+ArrayImage throughput benchmark - a producer thread writes NumPy frames into
+the back buffer and swaps while the consumer draws the front buffer.
+
+    python benchmarks/array_image.py [--width 1920] [--height 1080] [--seconds 5] [--window]
+
+Headless mode draws into a CPU surface as fast as possible; --window runs a
+real App and counts the frames it presents.
+"""
+import argparse
+import threading
+import time
+
+import numpy as np
+import skia
+
+from neui import App, ui
+from neui.core.renderer import Renderer
+
+def producer(view, stop, counter):
+    # Cheap moving gradient so every frame differs
+    w = view.width
+    ramp = np.arange(w, dtype=np.uint8)[None, :]
+    t = 0
+    while not stop.is_set():
+        frame = view.back_buffer()
+        frame[..., 0] = ramp + t
+        frame[..., 1] = t
+        frame[..., 2] = 128
+        frame[..., 3] = 255
+        view.swap()
+        counter[0] += 1
+        t = (t + 1) % 256
+
+def run_headless(view, seconds):
+    surface = skia.Surface.MakeRasterN32Premul(view.width, view.height)
+    canvas = surface.getCanvas()
+    renderer = Renderer()
+    view.computed_bounds = {'x': 0, 'y': 0, 'w': view.width, 'h': view.height}
+
+    drawn = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        view.render(canvas, renderer)
+        surface.flushAndSubmit()
+        drawn += 1
+    return drawn
+
+def run_window(view, seconds):
+    app = App(title="ArrayImage Benchmark", width=view.width, height=view.height)
+    app.add(ui.Box(style={'bg': '#000000'}, children=[view]))
+
+    frames = [0]
+    original_render = view.render
+    def counting_render(canvas, renderer):
+        frames[0] += 1
+        original_render(canvas, renderer)
+    view.render = counting_render
+
+    # glfw allows requesting window close from any thread
+    import glfw
+    threading.Timer(seconds, glfw.set_window_should_close, (app.window, True)).start()
+    app.run()
+    return frames[0]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--width', type=int, default=1920)
+    parser.add_argument('--height', type=int, default=1080)
+    parser.add_argument('--seconds', type=float, default=5.0)
+    parser.add_argument('--window', action='store_true')
+    args = parser.parse_args()
+
+    view = ui.ArrayImage(np.zeros((args.height, args.width, 4), np.uint8), buffer_count=3)
+
+    stop = threading.Event()
+    produced = [0]
+    thread = threading.Thread(target=producer, args=(view, stop, produced), daemon=True)
+    thread.start()
+
+    start = time.perf_counter()
+    drawn = run_window(view, args.seconds) if args.window else run_headless(view, args.seconds)
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    thread.join()
+
+    print(f"{args.width}x{args.height}, {'window' if args.window else 'headless'}")
+    print(f"produced: {produced[0] / elapsed:8.1f} frames/sec")
+    print(f"drawn:    {drawn / elapsed:8.1f} frames/sec")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Batch export benchmark - renders report pages to PNG (or PDF) across a
+process pool and reports pages per second for different worker counts.
+
+    python benchmarks/batch_export.py [--pages 200] [--format png] [--out /tmp/neui-export]
+"""
+import argparse
+import os
+import time
+
+from neui import ui, cui
+from neui.core.export import ExportJob, export_batch
+
+def build_report(page):
+    # Module-level so worker processes can import it
+    with ui.Box(style={'bg': '#0D1117', 'padding': 24, 'gap': 16}) as root:
+        ui.Text(f"Nightly report #{page}", style={'font_size': 28, 'color': '#58A6FF'})
+        with ui.Box(style={'layout': 'grid', 'grid_template_columns': '1fr 1fr 1fr', 'gap': 16}):
+            for i in range(12):
+                with cui.Card(style={'bg': '#161B22', 'shadow': 8, 'h': 160}):
+                    ui.Text(f"Metric {i + 1}", style={'font_size': 18, 'color': '#C9D1D9'})
+                    ui.Text("Requests served, p99 latency and error budget for the period.",
+                            style={'wrap': 'word', 'color': '#8B949E'})
+                    cui.ProgressBar(value=((page + i) % 10) / 10, style={'w': '100%', 'h': 10})
+    return root
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pages', type=int, default=200)
+    parser.add_argument('--format', choices=('png', 'pdf'), default='png')
+    parser.add_argument('--width', type=int, default=1240)
+    parser.add_argument('--height', type=int, default=1754)
+    parser.add_argument('--out', default=os.path.join('/tmp', 'neui-export'))
+    args = parser.parse_args()
+
+    os.makedirs(args.out, exist_ok=True)
+    jobs = [ExportJob(build_report, os.path.join(args.out, f"page-{i:05d}.{args.format}"),
+                      args.width, args.height, args=(i,))
+            for i in range(args.pages)]
+
+    cores = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, cores} & set(range(1, cores + 1)))
+
+    print(f"{args.pages} pages, {args.width}x{args.height} {args.format}")
+    baseline = None
+    for processes in counts:
+        start = time.perf_counter()
+        results = export_batch(jobs, processes=processes)
+        elapsed = time.perf_counter() - start
+        rate = sum(1 for r in results if r) / elapsed
+        baseline = baseline or rate
+        print(f"processes={processes:<3} {rate:8.1f} pages/sec  ({rate / baseline:.2f}x)")
+
+if __name__ == "__main__":
+    main()
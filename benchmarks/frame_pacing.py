@@ -0,0 +1,45 @@
+"""
+Frame pacing benchmark - redraws continuously under an FPS cap and/or
+vsync and reports the achieved rate, frame-time percentiles and how evenly
+frames were spaced.
+
+    python benchmarks/frame_pacing.py [--fps 10] [--no-vsync] [--seconds 5]
+"""
+import argparse
+import statistics
+import threading
+
+import glfw
+
+from neui import App, ui, cui
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--fps', type=float, default=None)
+    parser.add_argument('--no-vsync', action='store_true')
+    parser.add_argument('--seconds', type=float, default=5.0)
+    args = parser.parse_args()
+
+    app = App(title="Frame Pacing Benchmark", width=800, height=600, continuous=True,
+              vsync=not args.no_vsync, target_fps=args.fps)
+    with ui.Box(style={'bg': '#0D1117', 'padding': 20, 'gap': 10}) as root:
+        for i in range(30):
+            cui.ProgressBar(value=i / 30, style={'w': '100%', 'h': 8})
+    app.add(root)
+
+    threading.Timer(args.seconds, glfw.set_window_should_close, (app.window, True)).start()
+    app.run()
+
+    stats = app.frame_stats
+    s = stats.summary()
+    presented = list(stats.presented)
+    intervals = [(b - a) * 1000 for a, b in zip(presented, presented[1:])]
+
+    print(f"target: {args.fps or 'uncapped'} fps, vsync {'off' if args.no_vsync else 'on'}")
+    print(f"frames: {s['frames']} ({s['frames'] / args.seconds:.1f} fps), {s['dropped']} dropped")
+    print(f"frame time  mean {s['mean_ms']:.2f}  p50 {s['p50_ms']:.2f}  p95 {s['p95_ms']:.2f}  p99 {s['p99_ms']:.2f} ms")
+    if len(intervals) > 1:
+        print(f"interval    mean {statistics.mean(intervals):.2f}  stdev {statistics.stdev(intervals):.3f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Hit testing benchmark - lays out a grid of boxes (10k by default) and
+compares the old recursive tree walk with the HitIndex grid for random
+cursor positions. Runs without a window.
+
+    python benchmarks/hit_testing.py [--rows 100] [--cols 100] [--queries 10000]
+"""
+import argparse
+import random
+import time
+
+from neui.core.hittest import HitIndex
+from neui.core.layout import compute_layout
+from neui.ui.box import Box
+
+def build(rows, cols, width, height):
+    root = Box(style={'w': width, 'h': height, 'layout': 'col'})
+    for _ in range(rows):
+        row = root.add(Box(style={'w': width, 'h': height / rows, 'layout': 'row'}))
+        for _ in range(cols):
+            row.add(Box(style={'w': width / cols, 'h': height / rows}))
+    root.computed_bounds = {'x': 0, 'y': 0, 'w': width, 'h': height}
+    compute_layout(root, width, height)
+    return root
+
+def tree_walk(element, x, y):
+    # What EventManager did before the index
+    b = element.computed_bounds
+    if not (b['x'] <= x <= b['x'] + b['w'] and b['y'] <= y <= b['y'] + b['h']):
+        return None
+    for child in reversed(element.children):
+        hit = tree_walk(child, x, y)
+        if hit:
+            return hit
+    return element
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100)
+    parser.add_argument('--cols', type=int, default=100)
+    parser.add_argument('--queries', type=int, default=10000)
+    args = parser.parse_args()
+
+    width, height = 1920, 1080
+    root = build(args.rows, args.cols, width, height)
+    points = [(random.uniform(0, width), random.uniform(0, height)) for _ in range(args.queries)]
+
+    index = HitIndex()
+    start = time.perf_counter()
+    index.update([root])
+    build_time = time.perf_counter() - start
+    start = time.perf_counter()
+    index.update([root])
+    refresh_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    walked = [tree_walk(root, x, y) for x, y in points]
+    walk_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = [index.hit(x, y) for x, y in points]
+    index_time = time.perf_counter() - start
+
+    mismatches = sum(1 for a, b in zip(walked, indexed) if a is not b)
+    print(f"{len(index)} elements, {args.queries} queries")
+    print(f"index build      {build_time * 1000:8.2f} ms")
+    print(f"index refresh    {refresh_time * 1000:8.2f} ms (forced; skipped while layout_version() is unchanged)")
+    print(f"tree walk        {walk_time / args.queries * 1e6:8.2f} us/query")
+    print(f"grid index       {index_time / args.queries * 1e6:8.2f} us/query")
+    print(f"mismatches       {mismatches}")
+
+if __name__ == "__main__":
+    main()
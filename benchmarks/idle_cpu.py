@@ -0,0 +1,42 @@
+"""
+Idle CPU benchmark - opens a window with a static UI and measures the CPU
+time the process uses while nobody touches it, for the continuous loop
+and the default redraw-on-demand loop.
+
+    python benchmarks/idle_cpu.py [--seconds 5]
+"""
+import argparse
+import subprocess
+import sys
+
+SCRIPT = """
+import sys, threading, time
+import glfw
+from neui import App, ui, cui
+
+app = App(title="Idle Benchmark", width=640, height=480, continuous=sys.argv[1] == 'continuous')
+with ui.Box(style={'bg': '#0D1117', 'padding': 20, 'gap': 10}) as root:
+    for i in range(20):
+        cui.Button(f"Button {i + 1}")
+app.add(root)
+
+seconds = float(sys.argv[2])
+cpu_start, wall_start = time.process_time(), time.perf_counter()
+threading.Timer(seconds, glfw.set_window_should_close, (app.window, True)).start()
+app.run()
+print((time.process_time() - cpu_start) / (time.perf_counter() - wall_start))
+"""
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--seconds', type=float, default=5.0)
+    args = parser.parse_args()
+
+    for mode in ('continuous', 'on-demand'):
+        out = subprocess.run([sys.executable, '-c', SCRIPT, mode, str(args.seconds)],
+                             capture_output=True, text=True, check=True).stdout
+        usage = float(out.strip().splitlines()[-1])
+        print(f"{mode:<12}{usage * 100:6.1f}% of one core")
+
+if __name__ == "__main__":
+    main()
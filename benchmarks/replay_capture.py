@@ -0,0 +1,71 @@
+"""
+Replay benchmark for frame captures - rasterizes the .skp files saved by
+App.capture_frames() repeatedly and sets pure draw cost against the
+layout and Python recording times captured with them.
+
+    python benchmarks/replay_capture.py CAPTURE_DIR [--repeat 50] [--gpu]
+
+Without --gpu the pictures are rasterized on the CPU; --gpu uses an
+offscreen OpenGL surface from a hidden window.
+"""
+import argparse
+import statistics
+
+import skia
+
+from neui.core.capture import load_capture, replay
+
+def make_gpu_surface_factory():
+    import glfw
+    if not glfw.init():
+        raise RuntimeError("Could not initialize GLFW")
+    glfw.window_hint(glfw.VISIBLE, glfw.FALSE)
+    window = glfw.create_window(16, 16, "replay", None, None)
+    glfw.make_context_current(window)
+    context = skia.GrDirectContext.MakeGL()
+
+    def make_surface(width, height):
+        return skia.Surface.MakeRenderTarget(context, skia.Budgeted.kNo,
+                                             skia.ImageInfo.MakeN32Premul(width, height))
+    return make_surface
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('directory')
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--gpu', action='store_true')
+    args = parser.parse_args()
+
+    make_surface = make_gpu_surface_factory() if args.gpu else skia.Surface.MakeRasterN32Premul
+
+    frames = load_capture(args.directory)
+    if not frames:
+        print("No frames in capture")
+        return
+
+    print(f"{len(frames)} frame(s), {'GPU' if args.gpu else 'CPU'} replay x{args.repeat}")
+    print(f"{'frame':<16}{'size':>11}{'layout':>9}{'record':>9}{'present':>9}{'replay':>9}{'frame':>9}  (ms)")
+    totals = {'layout': 0.0, 'record': 0.0, 'replay': 0.0, 'frame': 0.0}
+    for entry, picture in frames:
+        surface = make_surface(entry['width'], entry['height'])
+        replay(picture, surface, 2) # Warm up
+        draw_ms = statistics.median(replay(picture, surface, args.repeat)) * 1000
+
+        print(f"{entry['file']:<16}{entry['width']:>5}x{entry['height']:<5}"
+              f"{entry.get('layout_ms', 0):>9.2f}{entry.get('record_ms', 0):>9.2f}"
+              f"{entry.get('present_ms', 0):>9.2f}{draw_ms:>9.2f}{entry.get('frame_ms', 0):>9.2f}")
+        totals['layout'] += entry.get('layout_ms', 0)
+        totals['record'] += entry.get('record_ms', 0)
+        totals['replay'] += draw_ms
+        totals['frame'] += entry.get('frame_ms', 0)
+
+    # record = walking the element tree in Python and issuing draw calls;
+    # replay = skia rasterizing the same commands with no Python involved
+    n = len(frames)
+    print()
+    for label, key in (("layout (Python)", 'layout'), ("render traversal (Python)", 'record'),
+                       ("raster (skia)", 'replay'), ("captured frame", 'frame')):
+        print(f"mean {label + ':':<27}{totals[key] / n:8.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Startup benchmark - measures `import neui` and time to first frame in fresh
+interpreters, the cost short-lived tool windows pay before the first paint.
+
+    python benchmarks/startup.py [--runs 10] [--no-window]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+IMPORT_SCRIPT = """
+import json, time
+start = time.perf_counter()
+import neui
+imported = time.perf_counter()
+from neui import ui, cui
+ui.Box, ui.Text, cui.Button
+widgets = time.perf_counter()
+print(json.dumps({'import': imported - start, 'widgets': widgets - start}))
+"""
+
+FIRST_FRAME_SCRIPT = """
+import json, time
+start = time.perf_counter()
+import glfw
+from neui import App, ui, cui
+
+times = {}
+swap_buffers = glfw.swap_buffers
+def first_swap(window):
+    swap_buffers(window)
+    if 'first_frame' not in times:
+        times['first_frame'] = time.perf_counter() - start
+        glfw.set_window_should_close(window, True)
+glfw.swap_buffers = first_swap
+
+app = App(title="Startup Benchmark", width=640, height=480)
+times['app'] = time.perf_counter() - start
+with ui.Box(style={'bg': '#0D1117', 'padding': 20, 'gap': 10}) as root:
+    ui.Text("Hello", style={'font_size': 24, 'color': '#58A6FF'})
+    cui.Button("OK")
+app.add(root)
+app.run()
+print(json.dumps(times))
+"""
+
+def run(script, runs):
+    samples = {}
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True).stdout
+        for key, value in json.loads(out.strip().splitlines()[-1]).items():
+            samples.setdefault(key, []).append(value * 1000)
+    return samples
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--no-window', action='store_true')
+    args = parser.parse_args()
+
+    labels = {
+        'import': "import neui",
+        'widgets': "+ first ui/cui widgets",
+        'app': "App() created",
+        'first_frame': "first frame presented",
+    }
+    results = run(IMPORT_SCRIPT, args.runs)
+    if not args.no_window:
+        results.update(run(FIRST_FRAME_SCRIPT, args.runs))
+
+    print(f"median of {args.runs} fresh interpreters (ms since start of script)")
+    for key, label in labels.items():
+        if key in results:
+            values = results[key]
+            print(f"{label:<26}{statistics.median(values):8.1f}   (min {min(values):.1f})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Tiled raster benchmark - rasterizes a 4K dashboard on the CPU and reports
+the speedup for different tile and worker process counts.
+
+    python benchmarks/tiled_raster.py [--width 3840] [--height 2160] [--repeat 5]
+"""
+import argparse
+import os
+import time
+
+from neui import ui, cui
+from neui.core.raster import record_frame, TiledRasterizer
+
+def build_dashboard():
+    with ui.Box(style={'bg': '#0D1117', 'padding': 20, 'layout': 'grid',
+                       'grid_template_columns': '1fr 1fr 1fr 1fr 1fr 1fr', 'gap': 20}) as root:
+        for i in range(48):
+            with cui.Card(style={'bg': '#161B22', 'shadow': 12, 'h': 240}):
+                ui.Text(f"Panel {i + 1}", style={'font_size': 22, 'color': '#58A6FF'})
+                ui.Text("Throughput, latency and error rates for the last hour of traffic.",
+                        style={'wrap': 'word', 'color': '#8B949E'})
+                cui.ProgressBar(value=(i % 10) / 10, style={'w': '100%', 'h': 12})
+    return root
+
+def time_rasterize(picture, width, height, tiles, processes, repeat):
+    with TiledRasterizer(tiles, processes=processes) as rasterizer:
+        rasterizer.rasterize(picture, width, height) # Warm up the pool
+        start = time.perf_counter()
+        for _ in range(repeat):
+            rasterizer.rasterize(picture, width, height)
+        return (time.perf_counter() - start) / repeat
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--width', type=int, default=3840)
+    parser.add_argument('--height', type=int, default=2160)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    picture = record_frame(build_dashboard(), args.width, args.height)
+    baseline = time_rasterize(picture, args.width, args.height, 1, 1, args.repeat)
+
+    cpus = os.cpu_count() or 1
+    process_counts = sorted({1, 2, 4, cpus})
+    print(f"{args.width}x{args.height}, {cpus} CPUs, baseline (1 tile, 1 process): {baseline * 1000:.1f} ms")
+    print(f"{'tiles':>7} {'processes':>9} {'ms':>9} {'speedup':>8}")
+    for tiles in (1, 2, 4, 8):
+        for processes in process_counts:
+            elapsed = time_rasterize(picture, args.width, args.height, tiles, processes, args.repeat)
+            print(f"{tiles}x{tiles:<5} {processes:>9} {elapsed * 1000:>9.1f} {baseline / elapsed:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,19 @@
 # Context stack for 'with' statement support
 _context_stack = []
 
-from .core.app import App
-from . import ui
-from . import cui
+import importlib
+
+# App, ui and cui are imported on first use, so `import neui` stays cheap
+# and skia/glfw load only when something needs them
+def __getattr__(name):
+    if name == 'App':
+        from .core.app import App
+        return App
+    if name in ('ui', 'cui'):
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = ['App', 'ui', 'cui']
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,9 +1,39 @@
+import asyncio
 import glfw
+import os
 import skia
+import sys
+import time
+import threading
+from collections import OrderedDict
 from .renderer import Renderer
-from .events import EventManager
-from .layout import compute_layout
+from .events import EventManager, handler_tasks, spawn_task
+from .layout import compute_layout, touch_layout
 from .animation import animation_manager
+from .images import image_loader
+from .pipeline import RenderThread
+from .quality import QualityGovernor
+from .capture import FrameCapture, default_capture_dir
+from .timers import TimerQueue
+from .tasks import BackgroundExecutor
+from .stats import FrameStats, LatencyStats
+from .profiler import FrameProfiler
+
+class _Identity:
+    """
+    Post key that matches one object by identity (not ==) and keeps it
+    alive until the post is drained, so its id can't be reused meanwhile.
+    """
+    __slots__ = ('obj',)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __hash__(self):
+        return id(self.obj)
+
+    def __eq__(self, other):
+        return isinstance(other, _Identity) and other.obj is self.obj
 
 class App:
     _instance = None
@@ -12,7 +42,10 @@ class App:
     def get_instance(cls):
         return cls._instance
 
-    def __init__(self, title="NEUI App", width=800, height=600, theme="dark"):
+    def __init__(self, title="NEUI App", width=800, height=600, theme="dark", pipelined=False, pipeline_depth=1,
+                 adaptive_quality=False, frame_budget_ms=None, quality_effects=None, batch_draws=False,
+                 continuous=False, idle_timeout=1.0, background_workers=4, background_processes=None,
+                 vsync=True, target_fps=None, stats_log_interval=None, profile=False):
         App._instance = self
         if not glfw.init():
             raise RuntimeError("Could not initialize GLFW")
@@ -27,8 +60,6 @@ class App:
             raise RuntimeError("Could not create GLFW window")
 
         # Windows Dark Mode Title Bar
-        import sys
-        import os
         if sys.platform == 'win32':
             try:
                 import ctypes
@@ -45,70 +76,25 @@ class App:
             except Exception as e:
                 print(f"Failed to set dark mode title bar: {e}")
 
-        # Set Window Icon
-        try:
-            # Look for icon in assets folder relative to this file
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            icon_path = os.path.join(current_dir, '..', 'assets', 'neui.png')
-            
-            if os.path.exists(icon_path):
-                # Load image using Skia
-                original_image = skia.Image.MakeFromEncoded(skia.Data.MakeFromFileName(icon_path))
-                if original_image:
-                    icon_images = []
-                    # Create icons for standard sizes
-                    for size in [16, 32, 48]:
-                        # Create a surface for resizing
-                        surface = skia.Surface.MakeRasterN32Premul(size, size)
-                        canvas = surface.getCanvas()
-                        # Draw scaled image
-                        canvas.drawImageRect(
-                            original_image,
-                            skia.Rect.MakeWH(original_image.width(), original_image.height()),
-                            skia.Rect.MakeWH(size, size),
-                            skia.SamplingOptions(skia.FilterMode.kLinear)
-                        )
-                        # Get snapshot
-                        image = surface.makeImageSnapshot()
-                        
-                        # Get pixels as bytes
-                        w, h = size, size
-                        bitmap = skia.Bitmap()
-                        bitmap.allocPixels(skia.ImageInfo.Make(
-                            w, h, 
-                            skia.kRGBA_8888_ColorType, 
-                            skia.kUnpremul_AlphaType
-                        ))
-                        if image.readPixels(bitmap.info(), bitmap.getPixels(), bitmap.rowBytes(), 0, 0):
-                            flat_pixels = bitmap.tobytes()
-                            # Convert flat bytes to 3D list [y][x][rgba] for glfw wrapper
-                            # This is slow but necessary for the wrapper
-                            # pixels is RGBA (4 bytes per pixel)
-                            formatted_pixels = []
-                            for y in range(h):
-                                row = []
-                                for x in range(w):
-                                    i = (y * w + x) * 4
-                                    # glfw expects [r, g, b, a] (or whatever the wrapper expects, likely just values)
-                                    pixel = [
-                                        flat_pixels[i],
-                                        flat_pixels[i+1],
-                                        flat_pixels[i+2],
-                                        flat_pixels[i+3]
-                                    ]
-                                    row.append(pixel)
-                                formatted_pixels.append(row)
-                            
-                            icon_images.append((w, h, formatted_pixels))
-                    
-                    # Set window icon
-                    if icon_images:
-                        glfw.set_window_icon(self.window, len(icon_images), icon_images)
-        except Exception as e:
-            print(f"Failed to set window icon: {e}")
+        # The icon is set after the first frame is on screen (see _set_window_icon)
+        self._icon_pending = True
 
         glfw.make_context_current(self.window)
         
+        # Frame pacing: vsync via the swap interval, target_fps via a limiter
+        self.vsync = vsync
+        self.target_fps = target_fps
+        glfw.swap_interval(1 if vsync else 0)
+        self._next_frame_at = None
+        self.frame_stats = FrameStats(budget_ms=self._frame_budget() * 1000, log_interval=stats_log_interval)
+        # Input-to-present latency per event type
+        self.latency = LatencyStats()
+        
+        # Per-phase frame profiler; app.profiler.enable(by_element=True) adds element types
+        self.profiler = FrameProfiler()
+        if profile:
+            self.profiler.enable()
+        
         # Initialize Skia GPU context (OpenGL)
         self.context = skia.GrDirectContext.MakeGL()
         self.surface = None
@@ -116,16 +102,108 @@ class App:
         
         self.root = None
         self.overlays = []
-        self.renderer = Renderer()
+        self.renderer = Renderer(batching=batch_draws)
         self.event_manager = EventManager(self.window)
         
+        # Pipelined mode: main thread records frames, a render thread presents them
+        self.pipelined = pipelined
+        self.pipeline_depth = pipeline_depth
+        self._render_thread = None
+        
+        # Adaptive quality: degrade expensive effects while frames run over budget
+        self.quality_governor = None
+        self._fixed_quality_budget = frame_budget_ms is not None
+        if adaptive_quality:
+            self.quality_governor = QualityGovernor(
+                self.renderer.quality,
+                # Default: the frame interval (target_fps or monitor refresh)
+                budget_ms=frame_budget_ms or self._frame_budget() * 1000,
+                effects=quality_effects
+            )
+        
+        # Redraw requests (see invalidate)
+        self._invalidate_lock = threading.Lock()
+        self._needs_full_redraw = True
+        self._running = False
+        self._loop_thread = None
+        
+        # asyncio integration (run_async / spawn)
+        self._async_loop = None
+        self._async_wake = None
+        # How often run_async polls glfw for input while idle (seconds)
+        self.async_input_interval = 0.01
+        
+        # Timers (set_timeout / set_interval), drained by run()
+        self.timers = TimerQueue()
+        
+        # Callbacks posted from other threads (see post), run once per iteration
+        self._post_lock = threading.Lock()
+        self._posted = OrderedDict()
+        
+        # Pools for run_in_background
+        self.background = BackgroundExecutor(self, background_workers, background_processes)
+        
+        # Redraw every iteration instead of sleeping until something changes
+        self.continuous = continuous
+        # Longest the idle loop sleeps between checks (seconds)
+        self.idle_timeout = idle_timeout
+        
+        # Active frame capture (see capture_frames)
+        self._capture = None
+        
         # Setup callbacks
         glfw.set_window_size_callback(self.window, self._on_resize)
+        glfw.set_window_refresh_callback(self.window, self._on_refresh)
         
         # Initial resize to setup surface
         self._on_resize(self.window, width, height)
 
-    def _on_resize(self, window, width, height):
+    def _set_window_icon(self):
+        try:
+            # Look for icon in assets folder relative to this file
+            current_dir = os.path.dirname(os.path.abspath(__file__))
+            icon_path = os.path.join(current_dir, '..', 'assets', 'neui.png')
+            if not os.path.exists(icon_path):
+                return
+            
+            original_image = skia.Image.MakeFromEncoded(skia.Data.MakeFromFileName(icon_path))
+            if not original_image:
+                return
+            
+            icon_images = []
+            # Create icons for standard sizes
+            for size in [16, 32, 48]:
+                surface = skia.Surface.MakeRasterN32Premul(size, size)
+                surface.getCanvas().drawImageRect(
+                    original_image,
+                    skia.Rect.MakeWH(original_image.width(), original_image.height()),
+                    skia.Rect.MakeWH(size, size),
+                    skia.SamplingOptions(skia.FilterMode.kLinear)
+                )
+                image = surface.makeImageSnapshot()
+                
+                bitmap = skia.Bitmap()
+                bitmap.allocPixels(skia.ImageInfo.Make(size, size, skia.kRGBA_8888_ColorType, skia.kUnpremul_AlphaType))
+                if not image.readPixels(bitmap.info(), bitmap.getPixels(), bitmap.rowBytes(), 0, 0):
+                    continue
+                pixels = bitmap.tobytes()
+                
+                # glfw's wrapper indexes pixels[y][x][channel]; 4-byte slices
+                # of the raw buffer serve as pixels without unpacking channels
+                row_bytes = size * 4
+                rows = [
+                    [pixels[i:i + 4] for i in range(y, y + row_bytes, 4)]
+                    for y in range(0, size * row_bytes, row_bytes)
+                ]
+                icon_images.append((size, size, rows))
+            
+            if icon_images:
+                glfw.set_window_icon(self.window, len(icon_images), icon_images)
+        except Exception as e:
+            print(f"Failed to set window icon: {e}")
+
+    @staticmethod
+    def _make_surface(context, width, height):
         # Create a new surface matching the window size
         backend_render_target = skia.GrBackendRenderTarget(
             width,
@@ -135,22 +213,250 @@ class App:
             skia.GrGLFramebufferInfo(0, 0x8058)  # 0x8058 = GL_RGBA8
         )
         
-        self.surface = skia.Surface.MakeFromBackendRenderTarget(
-            self.context,
+        return skia.Surface.MakeFromBackendRenderTarget(
+            context,
             backend_render_target,
             skia.kBottomLeft_GrSurfaceOrigin,
             skia.kRGBA_8888_ColorType,
             skia.ColorSpace.MakeSRGB()
         )
-        self.canvas = self.surface.getCanvas()
+
+    def _on_resize(self, window, width, height):
+        # In pipelined mode the render thread owns the GL context and
+        # recreates its surface when it sees a frame of a new size.
+        if not self._render_thread:
+            self.surface = self._make_surface(self.context, width, height)
+            self.canvas = self.surface.getCanvas()
         
         # Update root size if it exists
         if self.root:
             self.root.style['w'] = width
             self.root.style['h'] = height
+        self.invalidate()
+
+    def _on_refresh(self, window):
+        # Window contents were damaged (uncovered, restored, ...)
+        self.invalidate()
+
+    def _frame_budget(self):
+        # Seconds per frame: the FPS cap, else the monitor's refresh rate
+        if self.target_fps:
+            return 1.0 / self.target_fps
+        monitor = glfw.get_primary_monitor()
+        mode = glfw.get_video_mode(monitor) if monitor else None
+        refresh = mode.refresh_rate if mode and mode.refresh_rate else 60
+        return 1.0 / refresh
+
+    def set_target_fps(self, fps):
+        """
+        Cap the frame rate (None removes the cap).
+        """
+        self.target_fps = fps
+        self._next_frame_at = None
+        self.frame_stats.budget = self._frame_budget()
+        if self.quality_governor and not self._fixed_quality_budget:
+            self.quality_governor.budget = self._frame_budget()
+
+    def set_vsync(self, enabled):
+        self.vsync = enabled
+        if not self._render_thread:
+            glfw.swap_interval(1 if enabled else 0)
+        else:
+            # The render thread owns the context and applies it itself
+            self._render_thread.set_swap_interval(1 if enabled else 0)
+
+    def _frame_delay(self):
+        """
+        Seconds to wait before the next frame may start under target_fps.
+        """
+        if not self.target_fps:
+            return 0.0
+        interval = 1.0 / self.target_fps
+        now = time.perf_counter()
+        if self._next_frame_at is None or now - self._next_frame_at > interval:
+            # First frame, or we fell behind/were idle: restart the cadence
+            self._next_frame_at = now + interval
+        else:
+            self._next_frame_at += interval
+        return max(0.0, self._next_frame_at - now)
+
+    @staticmethod
+    def _sleep_until(deadline):
+        # time.sleep can overshoot by a millisecond or more; sleep most of
+        # the way, then spin for the rest
+        remaining = deadline - time.perf_counter()
+        if remaining > 0.002:
+            time.sleep(remaining - 0.002)
+        while time.perf_counter() < deadline:
+            pass
+
+    @property
+    def quality_level(self):
+        """
+        Current degradation level (0 = full quality).
+        """
+        return self.quality_governor.level if self.quality_governor else 0
+
+    def invalidate(self):
+        """
+        Request a redraw of the window. Safe to call from any thread.
+        """
+        with self._invalidate_lock:
+            self._needs_full_redraw = True
+        if not self.continuous:
+            self._wake_loop()
+
+    def _wake_loop(self):
+        """
+        Wake the main loop if it is sleeping. Safe from any thread.
+        """
+        if not self._running: return
+        loop = self._async_loop
+        if loop:
+            try:
+                loop.call_soon_threadsafe(self._async_wake.set)
+            except RuntimeError:
+                pass # Loop already closed
+        else:
+            glfw.post_empty_event()
+
+    def set_timeout(self, delay, callback, *args):
+        """
+        Call callback(*args) on the UI thread after `delay` seconds.
+        Returns a Timer; pass it to cancel().
+        """
+        return self._schedule(delay, callback, args, None)
+
+    def set_interval(self, interval, callback, *args):
+        """
+        Call callback(*args) on the UI thread every `interval` seconds
+        until cancelled.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        return self._schedule(interval, callback, args, interval)
+
+    def cancel(self, timer):
+        if timer:
+            timer.cancel()
+
+    def redraw_after(self, delay):
+        """
+        Request a redraw `delay` seconds from now.
+        """
+        return self.set_timeout(delay, self.invalidate)
+
+    def _schedule(self, delay, callback, args, interval):
+        timer = self.timers.schedule(delay, callback, args, interval)
+        # Another thread may have moved the next deadline: let the loop
+        # recompute how long to sleep
+        if threading.current_thread() is not self._loop_thread:
+            self._wake_loop()
+        return timer
+
+    def post(self, callback, *args, key=None):
+        """
+        Run callback(*args) on the UI thread before the next frame. Safe
+        from any thread; this is how workers should touch elements:
+
+            app.post(bar.set_value, 0.4, key=(bar, 'value'))
+
+        Posts with the same key coalesce: only the latest callback runs, in
+        the position of the first one. Posts without a key all run, in order.
+        """
+        with self._post_lock:
+            was_empty = not self._posted
+            self._posted[object() if key is None else key] = (callback, args)
+        if was_empty and threading.current_thread() is not self._loop_thread:
+            self._wake_loop()
+
+    # asyncio-style spelling
+    call_soon_threadsafe = post
+
+    def post_set(self, target, name, value):
+        """
+        Set target.<name> = value on the UI thread, coalescing repeated
+        updates of the same attribute within a frame.
+        """
+        self.post(setattr, target, name, value, key=(_Identity(target), name))
+
+    def run_in_background(self, fn, on_progress=None, on_done=None, args=(), kwargs=None, process=False):
+        """
+        Run fn off the UI thread and return a BackgroundTask.
+
+        Thread mode calls fn(task, *args, **kwargs); fn may call
+        task.report(progress, message) and task.check_cancelled().
+        process=True calls fn(*args, **kwargs) in a process pool instead
+        (fn must be picklable; no progress reports). Workers are spawned,
+        so the script needs an `if __name__ == "__main__":` guard.
+
+        on_progress(progress, message) and on_done(result, error) run on
+        the UI thread.
+        """
+        task = self.background.submit(fn, args, kwargs, process)
+        if on_progress:
+            task.add_progress_listener(on_progress)
+        if on_done:
+            task.add_done_listener(on_done)
+        return task
+
+    def _run_posted(self):
+        with self._post_lock:
+            if not self._posted:
+                return 0
+            posted, self._posted = self._posted, OrderedDict()
+        for callback, args in posted.values():
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"Posted callback failed: {e}")
+        return len(posted)
+
+    def _has_pending_work(self):
+        return bool(
+            self._posted
+            or animation_manager.animations
+            or self._needs_full_redraw
+            or self.event_manager.activity
+        )
+
+    def _wait_for_work(self):
+        """
+        Sleep until input, an invalidation, a finished image decode or the
+        next timer; just poll while there is work to do.
+        """
+        if self.continuous or self._has_pending_work():
+            glfw.poll_events()
+            return
+        
+        timeout = self.idle_timeout
+        deadline = self.timers.next_deadline()
+        if deadline is not None:
+            timeout = min(timeout, deadline - time.perf_counter())
+        if timeout > 0:
+            glfw.wait_events_timeout(timeout)
+        else:
+            glfw.poll_events()
+
+    def _take_invalidations(self):
+        with self._invalidate_lock:
+            full = self._needs_full_redraw
+            self._needs_full_redraw = False
+        return full
+
+    def capture_frames(self, frames=1, directory=None):
+        """
+        Save the next `frames` frames as .skp files plus their layout, event
+        and draw timings. Returns the capture directory.
+        """
+        directory = directory or default_capture_dir()
+        self._capture = FrameCapture(directory, frames)
+        print(f"Capturing {frames} frame(s) to {directory}")
+        return directory
 
     def add(self, element):
         self.root = element
+        touch_layout()
         # Set initial root size to window size
         width, height = glfw.get_window_size(self.window)
         self.root.style['w'] = width
@@ -158,45 +464,272 @@ class App:
 
     def add_overlay(self, element):
         self.overlays.append(element)
+        touch_layout()
 
     def remove_overlay(self, element):
         if element in self.overlays:
             self.overlays.remove(element)
+            element._detach()
+            touch_layout()
 
-    def run(self):
-        while not glfw.window_should_close(self.window):
-            glfw.poll_events()
-            
-            # 1. Handle Events (delegated to EventManager)
-            self.event_manager.process_events(self.root, self.overlays)
-            
-            # 1.5 Update Animations
-            animation_manager.update()
+    def _layout(self, width, height):
+        if self.root:
+            # Ensure root fills window
+            self.root.computed_bounds = {'x': 0, 'y': 0, 'w': width, 'h': height}
+            compute_layout(self.root, width, height)
             
-            # 2. Layout Pass
-            if self.root:
-                width, height = glfw.get_window_size(self.window)
-                # Ensure root fills window
-                self.root.computed_bounds = {'x': 0, 'y': 0, 'w': width, 'h': height}
-                compute_layout(self.root, width, height)
-                
-            # Layout Overlays
-            for overlay in self.overlays:
-                overlay.computed_bounds = {'x': 0, 'y': 0, 'w': width, 'h': height}
-                compute_layout(overlay, width, height)
+        # Layout Overlays
+        for overlay in self.overlays:
+            overlay.computed_bounds = {'x': 0, 'y': 0, 'w': width, 'h': height}
+            compute_layout(overlay, width, height)
+
+    def _draw(self, canvas):
+        canvas.clear(skia.Color(30, 30, 30)) # Default dark bg
+        
+        if self.root:
+            self.root.render(canvas, self.renderer)
             
-            # 3. Render Pass
-            if self.surface:
-                self.canvas.clear(skia.Color(30, 30, 30)) # Default dark bg
-                
-                if self.root:
-                    self.root.render(self.canvas, self.renderer)
-                    
-                # Render Overlays (Toasts, Modals, Dropdowns)
-                for overlay in self.overlays:
-                    overlay.render(self.canvas, self.renderer)
-                
-                self.surface.flushAndSubmit()
-                glfw.swap_buffers(self.window)
+        # Render Overlays (Toasts, Modals, Dropdowns)
+        for overlay in self.overlays:
+            overlay.render(canvas, self.renderer)
+        
+        # Draw whatever the renderer is still batching
+        self.renderer.flush(canvas)
+
+    def _record_frame(self, width, height):
+        recorder = skia.PictureRecorder()
+        canvas = recorder.beginRecording(skia.Rect.MakeWH(width, height))
+        self._draw(canvas)
+        return recorder.finishRecordingAsPicture()
+
+    def _render_frame(self, frame_start, events_done, prof=None, inputs=None):
+        # 2. Layout Pass
+        width, height = glfw.get_window_size(self.window)
+        update_done = time.perf_counter()
+        self._layout(width, height)
+        self.event_manager.update_hit_index(self.root, self.overlays)
+        layout_done = time.perf_counter()
+        if prof: prof.mark('layout')
+        
+        # 3. Render Pass
+        capture = self._capture
+        picture = None
+        draw_calls = self.renderer.draw_calls
+        if self._render_thread:
+            # Record frame N; the render thread presents N-1 meanwhile
+            picture = self._record_frame(width, height)
+            record_done = time.perf_counter()
+            if prof: prof.mark('render')
+            on_present = None
+            if inputs:
+                on_present = lambda presented: self.latency.record(inputs, presented)
+            # Blocking on a full queue is back-pressure, not work
+            work_done = record_done
+            self._render_thread.submit(picture, width, height, on_present)
+        elif self.surface:
+            if capture:
+                # Record once, then play the same commands to the screen
+                picture = self._record_frame(width, height)
+                record_done = time.perf_counter()
+                self.canvas.drawPicture(picture)
+            else:
+                self._draw(self.canvas)
+                record_done = time.perf_counter()
+            if prof: prof.mark('render')
+            self.surface.flushAndSubmit()
+            work_done = time.perf_counter()
+            glfw.swap_buffers(self.window)
+            if inputs:
+                self.latency.record(inputs, time.perf_counter())
+        else:
+            record_done = work_done = time.perf_counter()
+        frame_end = time.perf_counter()
+        if prof: prof.mark('present')
+        
+        if self.quality_governor:
+            # Excludes the swap: with vsync it waits for the display, and
+            # every frame would look exactly one interval long
+            self.quality_governor.record(work_done - frame_start)
+        self.frame_stats.record(frame_start, frame_end)
+        
+        if self._icon_pending:
+            # Deferred so decoding the icon doesn't delay the first paint
+            self._icon_pending = False
+            self._set_window_icon()
+        
+        if capture and picture is not None:
+            capture.add_frame(picture, width, height, {
+                'events': events_done - frame_start,
+                'update': update_done - events_done,
+                'layout': layout_done - update_done,
+                'record': record_done - layout_done,
+                'present': frame_end - record_done,
+                'frame': frame_end - frame_start,
+            }, draw_calls=self.renderer.draw_calls - draw_calls)
+            if capture.done:
+                print(f"Frame capture saved to {capture.directory}")
+                self._capture = None
+
+    def _start_pipeline(self):
+        # Hand the GL context over to the render thread
+        self.surface = None
+        self.canvas = None
+        glfw.make_context_current(None)
+        self._render_thread = RenderThread(self.window, self.context, self._make_surface, self.pipeline_depth,
+                                           swap_interval=1 if self.vsync else 0)
+        self._render_thread.start()
+
+    def _stop_pipeline(self):
+        self._render_thread.stop()
+        self._render_thread = None
+        glfw.make_context_current(self.window)
+
+    def _start_run(self):
+        if self.pipelined:
+            self._start_pipeline()
+        if not self.continuous:
+            # Finished background decodes wake the loop like input does
+            image_loader.wake = self._wake_loop
+        self._running = True
+        self._loop_thread = threading.current_thread()
+
+    def _iteration(self):
+        """
+        One pass of the main loop after events were polled: timers, input,
+        animations and image decodes, then a frame if anything changed.
+        Returns True if a frame was rendered.
+        """
+        # Costs one attribute check per phase while disabled
+        prof = self.profiler if self.profiler.enabled else None
+        if prof: prof.begin_frame()
+        frame_start = time.perf_counter()
+        activity = self.event_manager.take_activity()
+        
+        # Timer callbacks and updates posted by other threads usually
+        # change what is on screen
+        fired = self.timers.run_due()
+        posted = self._run_posted()
+        if prof: prof.mark('timers')
+        
+        # 1. Handle Events (delegated to EventManager)
+        self.event_manager.process_events(self.root, self.overlays)
+        inputs = self.event_manager.take_input_times()
+        events_done = time.perf_counter()
+        if prof: prof.mark('events')
+        
+        # 1.5 Update Animations
+        animating = animation_manager.update()
+        if prof: prof.mark('animation')
+        
+        # Hand finished background image decodes to their elements
+        loaded = image_loader.poll()
+        if prof: prof.mark('images')
+        
+        # Element-scoped requests still repaint the whole window
+        full = self._take_invalidations()
+        
+        if not (self.continuous or activity or fired or posted or animating or loaded or full):
+            if not self.quality_level:
+                if prof: prof.discard_frame()
+                return False
+            # Idle while degraded: leave a full-quality frame on screen
+            self.quality_governor.reset()
+        
+        self._render_frame(frame_start, events_done, prof, inputs)
+        if prof: prof.end_frame()
+        return True
+
+    def _stop_run(self):
+        self._running = False
+        self.background.shutdown()
+        if self._render_thread:
+            self._stop_pipeline()
+        if self._capture and self._capture.frames:
+            # Window closed mid-capture: keep what was recorded
+            self._capture.finish()
+            self._capture = None
+        image_loader.wake = None
+        image_loader.shutdown()
+        # Only loaded if something enabled the thumbnail cache
+        thumbnails = sys.modules.get('neui.core.thumbnails')
+        if thumbnails:
+            thumbnails.thumbnail_cache.shutdown()
+
+    def run(self):
+        self._start_run()
+        try:
+            while not glfw.window_should_close(self.window):
+                self._wait_for_work()
+                if self._iteration():
+                    delay = self._frame_delay()
+                    if delay:
+                        self._sleep_until(time.perf_counter() + delay)
+        finally:
+            self._stop_run()
         
         glfw.terminate()
+
+    async def run_async(self):
+        """
+        Run the app inside an asyncio event loop, so coroutines (including
+        `async def` event handlers) share the thread with the UI:
+
+            asyncio.run(app.run_async())
+
+        Frames are driven between other tasks; while idle the loop awaits
+        invalidations and timers, and polls input every async_input_interval.
+        """
+        self._async_loop = asyncio.get_running_loop()
+        self._async_wake = asyncio.Event()
+        self._start_run()
+        try:
+            while not glfw.window_should_close(self.window):
+                glfw.poll_events()
+                if self._iteration():
+                    delay = self._frame_delay()
+                    if delay:
+                        await asyncio.sleep(delay)
+                await self._async_wait()
+        finally:
+            self._stop_run()
+            for task in list(handler_tasks):
+                if task.get_loop() is self._async_loop:
+                    task.cancel()
+            self._async_loop = None
+        
+        glfw.terminate()
+
+    async def _async_wait(self):
+        if self.continuous or self._has_pending_work():
+            # Let other tasks run between frames; swap_buffers paces us
+            await asyncio.sleep(0)
+            return
+        
+        # glfw can't hand input to asyncio, so input is polled on a short
+        # interval; invalidate() and new timers wake us right away
+        timeout = min(self.idle_timeout, self.async_input_interval)
+        deadline = self.timers.next_deadline()
+        if deadline is not None:
+            timeout = min(timeout, deadline - time.perf_counter())
+        if timeout <= 0:
+            await asyncio.sleep(0)
+            return
+        
+        self._async_wake.clear()
+        try:
+            await asyncio.wait_for(self._async_wake.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def spawn(self, coro):
+        """
+        Schedule a coroutine on the app's asyncio loop (see run_async).
+        The window is redrawn when it finishes. Returns the Task; raises
+        RuntimeError under plain App.run(), where there is no loop.
+        """
+        return spawn_task(self._async_loop, coro, self._task_done)
+
+    def _task_done(self, task):
+        if not task.cancelled() and task.exception():
+            print(f"Task failed: {task.exception()!r}")
+        self.invalidate()
@@ -0,0 +1,230 @@
+import math
+import skia
+from collections import OrderedDict
+
+_RECTS = 'rects'
+
+# Pending items are indexed on this grid, so finding what a new primitive
+# overlaps only looks at its neighbours
+_CELL = 32
+
+class _Batch:
+    __slots__ = ('key', 'sprite', 'items', 'index')
+
+    def __init__(self, key, index, sprite=None):
+        self.key = key
+        self.index = index  # Position in DrawBatcher.batches, -1 once drawn
+        self.sprite = sprite
+        self.items = []
+
+class DrawBatcher:
+    """
+    Collects primitives during traversal and draws them in as few calls as
+    possible:
+    - plain rect fills of any color become one drawVertices call
+    - rounded rects, circles, strokes and small solid-color paths (check
+      marks, icons) of the same shape and size become one drawAtlas call,
+      stamping a cached white sprite tinted per instance
+
+    Sprites are stamped at whole pixels with nearest sampling; the subpixel
+    offset is baked into the sprite, so output matches drawing directly. A
+    shape gets a sprite the second time its key is seen (within this or an
+    earlier frame); sizes that keep changing are drawn directly instead.
+
+    A primitive only joins an earlier batch if nothing drawn in between
+    overlaps it, so paint order is preserved. The Renderer flushes the
+    batches up to the last one a direct draw overlaps before making it, and
+    everything before every save/restore/clip/translate.
+    """
+    def __init__(self, max_sprites=256, max_path_points=32):
+        self.batches = []
+        self.max_sprites = max_sprites
+        self.max_path_points = max_path_points
+        self._sprites = OrderedDict()
+        self._seen = OrderedDict()  # sprite keys seen once, not worth a sprite yet
+        self._grid = {}  # (cx, cy) -> [(batch, l, t, r, b)] of pending items
+        self._latest = {}  # key -> newest batch with that key
+
+    def _last_overlapping(self, l, t, r, b):
+        """
+        Index of the newest pending batch with an item overlapping the rect,
+        or -1.
+        """
+        last = -1
+        grid = self._grid
+        for cx in range(int(l // _CELL), int(r // _CELL) + 1):
+            for cy in range(int(t // _CELL), int(b // _CELL) + 1):
+                for batch, il, it, ir, ib in grid.get((cx, cy), ()):
+                    if batch.index > last and l < ir and r > il and t < ib and b > it:
+                        last = batch.index
+        return last
+
+    def _add(self, key, item, l, t, r, b, sprite=None):
+        # Join the newest batch with the same key unless something drawn
+        # after it overlaps this primitive, which must stay on top
+        batch = self._latest.get(key)
+        if batch is None or batch.index < 0 or batch.index <= self._last_overlapping(l, t, r, b):
+            batch = _Batch(key, len(self.batches), sprite)
+            self.batches.append(batch)
+            self._latest[key] = batch
+        batch.items.append(item)
+
+        entry = (batch, l, t, r, b)
+        grid = self._grid
+        for cx in range(int(l // _CELL), int(r // _CELL) + 1):
+            for cy in range(int(t // _CELL), int(b // _CELL) + 1):
+                cell = grid.get((cx, cy))
+                if cell is None:
+                    grid[(cx, cy)] = [entry]
+                else:
+                    cell.append(entry)
+
+    def add_rect(self, x, y, w, h, color):
+        self._add(_RECTS, (x, y, w, h, color), x, y, x + w, y + h)
+
+    def add_shape(self, shape, x, y, w, h, color, radius=0, stroke=0):
+        """
+        shape: 'rrect' or 'oval'. stroke > 0 draws an outline of that width.
+        Returns False if the caller should draw it directly instead.
+        """
+        pad = stroke / 2 + 1
+        l, t = x - pad, y - pad
+        # Stamp at whole pixels, with the fractional offset inside the sprite
+        left, top = math.floor(l), math.floor(t)
+        fx, fy = round(l - left, 2), round(t - top, 2)
+        key = (shape, round(w, 2), round(h, 2), round(radius, 2), stroke, fx, fy)
+
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            def draw(canvas):
+                paint = skia.Paint(Color=skia.ColorWHITE, AntiAlias=True)
+                if stroke:
+                    paint.setStyle(skia.Paint.kStroke_Style)
+                    paint.setStrokeWidth(stroke)
+                rect = skia.Rect.MakeXYWH(pad + fx, pad + fy, w, h)
+                if shape == 'oval':
+                    canvas.drawOval(rect, paint)
+                else:
+                    canvas.drawRRect(skia.RRect.MakeRectXY(rect, radius, radius), paint)
+
+            sprite = self._new_sprite(key, (math.ceil(w + pad * 2 + fx), math.ceil(h + pad * 2 + fy)), draw)
+            if sprite is None:
+                return False
+        else:
+            self._sprites.move_to_end(key)
+        return self._stamp(key, sprite, left, top, color)
+
+    def add_path(self, path, paint):
+        """
+        Small paths drawn with a plain color paint. Returns False if the
+        caller should draw it directly (big paths, shaders, effects).
+        """
+        if (path.countPoints() > self.max_path_points or paint.getShader() or paint.getPathEffect()
+                or paint.getMaskFilter() or paint.getColorFilter() or paint.getImageFilter()
+                or paint.getBlendMode() != skia.BlendMode.kSrcOver):
+            return False
+
+        bounds = path.computeTightBounds()
+        # Generous for miter joins and caps
+        pad = paint.getStrokeWidth() + 1
+        left, top = math.floor(bounds.left() - pad), math.floor(bounds.top() - pad)
+        local = skia.Path(path)
+        local.offset(-left, -top)
+        size = (math.ceil(bounds.right() + pad) - left, math.ceil(bounds.bottom() + pad) - top)
+        key = ('path', bytes(local.serialize()), paint.getStyle(), paint.getStrokeWidth(),
+               paint.getStrokeCap(), paint.getStrokeJoin(), paint.getStrokeMiter(), paint.isAntiAlias(), size)
+
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            def draw(canvas):
+                white = skia.Paint(paint)
+                white.setColor(skia.ColorWHITE)
+                canvas.drawPath(local, white)
+
+            sprite = self._new_sprite(key, size, draw)
+            if sprite is None:
+                return False
+        else:
+            self._sprites.move_to_end(key)
+        return self._stamp(key, sprite, left, top, paint.getColor())
+
+    def _stamp(self, key, sprite, left, top, color):
+        self._add(key, (left, top, color), left, top, left + sprite.width(), top + sprite.height(), sprite)
+        return True
+
+    def flush(self, canvas, count=None):
+        """
+        Draws the first `count` pending batches (all by default) in order.
+        Returns the number of draw calls.
+        """
+        batches = self.batches if count is None else self.batches[:count]
+        for batch in batches:
+            if batch.key == _RECTS:
+                self._draw_rects(canvas, batch.items)
+            else:
+                self._draw_sprites(canvas, batch.sprite, batch.items)
+            batch.index = -1
+
+        if count is None or count >= len(self.batches):
+            self.batches = []
+            self._grid = {}
+            self._latest = {}
+        else:
+            # Drawn batches' grid entries are skipped by their index until
+            # the next full flush clears the grid
+            self.batches = self.batches[count:]
+            for index, batch in enumerate(self.batches):
+                batch.index = index
+        return len(batches)
+
+    def flush_under(self, canvas, l, t, r, b):
+        """
+        Before a direct draw at (l, t, r, b): draws the batches up to the
+        last one it overlaps. Later batches don't overlap it and stay
+        pending, drawn after it, which keeps paint order.
+        """
+        count = self._last_overlapping(l, t, r, b) + 1
+        return self.flush(canvas, count) if count else 0
+
+    def _draw_rects(self, canvas, items):
+        positions = []
+        colors = []
+        for x, y, w, h, color in items:
+            r, b = x + w, y + h
+            # Two triangles per rect
+            positions.extend((
+                skia.Point(x, y), skia.Point(r, y), skia.Point(r, b),
+                skia.Point(x, y), skia.Point(r, b), skia.Point(x, b),
+            ))
+            colors.extend((color,) * 6)
+        vertices = skia.Vertices.MakeCopy(skia.Vertices.kTriangles_VertexMode, positions, None, colors)
+        canvas.drawVertices(vertices, skia.Paint(Color=skia.ColorWHITE), skia.BlendMode.kModulate)
+
+    def _draw_sprites(self, canvas, sprite, items):
+        tex = skia.Rect.MakeWH(sprite.width(), sprite.height())
+        xforms = [skia.RSXform(1, 0, x, y) for x, y, _ in items]
+        texs = [tex] * len(items)
+        colors = [color for _, _, color in items]
+        # White sprite * per-instance color = tinted copy. Whole-pixel
+        # xforms + nearest sampling copy the sprite's pixels exactly.
+        canvas.drawAtlas(sprite, xforms, texs, colors, skia.BlendMode.kModulate,
+                         skia.SamplingOptions(skia.FilterMode.kNearest))
+
+    def _new_sprite(self, key, size, draw):
+        # First sighting: the caller draws directly, the size may never come back
+        if self._seen.pop(key, None) is None:
+            self._seen[key] = True
+            if len(self._seen) > self.max_sprites * 4:
+                self._seen.popitem(last=False)
+            return None
+
+        surface = skia.Surface.MakeRasterN32Premul(*size)
+        canvas = surface.getCanvas()
+        canvas.clear(skia.ColorTRANSPARENT)
+        draw(canvas)
+        sprite = surface.makeImageSnapshot()
+
+        self._sprites[key] = sprite
+        if len(self._sprites) > self.max_sprites:
+            self._sprites.popitem(last=False)
+        return sprite
@@ -0,0 +1,87 @@
+import json
+import os
+import time
+import skia
+
+CAPTURE_INDEX = 'capture.json'
+
+class FrameCapture:
+    """
+    Saves the draw commands of the next N frames as skia Picture files
+    (.skp) with the frame's phase timings in capture.json. Started through
+    App.capture_frames(); replay the result with benchmarks/replay_capture.py
+    or any skia tool that opens .skp files (e.g. the skia debugger).
+    """
+    def __init__(self, directory, frames=1):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.remaining = frames
+        self.frames = []
+        self.started = time.time()
+
+    @property
+    def done(self):
+        return self.remaining <= 0
+
+    def add_frame(self, picture, width, height, timings, draw_calls=None):
+        """
+        timings: phase name -> seconds, measured before the .skp is written
+        so file I/O doesn't show up in the numbers.
+        """
+        name = f"frame-{len(self.frames):04d}.skp"
+        with open(os.path.join(self.directory, name), 'wb') as f:
+            f.write(bytes(picture.serialize()))
+
+        entry = {'file': name, 'width': width, 'height': height}
+        for phase, seconds in timings.items():
+            entry[f"{phase}_ms"] = round(seconds * 1000, 3)
+        if draw_calls is not None:
+            entry['draw_calls'] = draw_calls
+        self.frames.append(entry)
+
+        self.remaining -= 1
+        if self.done:
+            self.finish()
+
+    def finish(self):
+        index = {
+            'started': self.started,
+            'frames': self.frames,
+        }
+        with open(os.path.join(self.directory, CAPTURE_INDEX), 'w') as f:
+            json.dump(index, f, indent=2)
+
+def default_capture_dir():
+    return os.path.abspath(time.strftime('neui-capture-%Y%m%d-%H%M%S'))
+
+def load_capture(directory):
+    """
+    Returns [(frame entry, skia.Picture)] for a capture directory.
+    """
+    with open(os.path.join(directory, CAPTURE_INDEX)) as f:
+        index = json.load(f)
+
+    frames = []
+    for entry in index['frames']:
+        data = skia.Data.MakeFromFileName(os.path.join(directory, entry['file']))
+        picture = skia.Picture.MakeFromData(data) if data else None
+        if picture is None:
+            print(f"Could not load {entry['file']}")
+            continue
+        frames.append((entry, picture))
+    return frames
+
+def replay(picture, surface, repeat=20):
+    """
+    Draws picture into surface repeatedly and returns the time of each
+    draw in seconds. This is pure skia raster cost: no Python element tree,
+    layout or event handling is involved.
+    """
+    canvas = surface.getCanvas()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        canvas.drawPicture(picture)
+        surface.flushAndSubmit(skia.GrSyncCpu.kYes)
+        times.append(time.perf_counter() - start)
+    return times
@@ -1,62 +1,212 @@
+import asyncio
 import glfw
+import inspect
+import time
+from .hittest import HitIndex
+from .layout import layout_version
+
+# Tasks started by spawn_task; the loop only holds tasks weakly
+handler_tasks = set()
+
+def spawn_task(loop, coro, on_done=None):
+    """
+    Schedule coro on loop, keeping the task referenced until it finishes.
+    With no loop the coroutine is closed and RuntimeError is raised.
+    """
+    if loop is None:
+        coro.close()
+        raise RuntimeError(f"No asyncio loop to run {coro.__qualname__}: coroutine handlers need App.run_async() or a running loop")
+    task = loop.create_task(coro)
+    handler_tasks.add(task)
+    task.add_done_callback(handler_tasks.discard)
+    if on_done:
+        task.add_done_callback(on_done)
+    return task
+
+def call_handler(handler, *args, **kwargs):
+    """
+    Call an event handler or user callback. Coroutine functions (async def)
+    are scheduled as tasks on the app's asyncio loop (App.run_async), or on
+    the running asyncio loop when there is no App.
+    """
+    result = handler(*args, **kwargs)
+    if inspect.iscoroutine(result):
+        from .app import App
+        app = App.get_instance()
+        if app:
+            return app.spawn(result)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        return spawn_task(loop, result)
+    return result
+
+class Event:
+    """
+    Passed to listeners added with Element.add_event_listener. `target` is
+    the element the event happened on and `current_target` the element
+    whose listener is running. Handler arguments (x, y, key, ...) are
+    attributes. For delegation, `child` is the child of current_target
+    that contains the target, and `index` is its position:
+
+        def on_row_click(event):
+            select(rows[event.index])
+        table.add_event_listener('click', on_row_click)
+    """
+    def __init__(self, type, target, data, time=None):
+        self.type = type
+        self.target = target
+        self.current_target = None
+        self.phase = None  # 'capture', 'target' or 'bubble'
+        self.data = data
+        self.time = time   # Input arrival (time.perf_counter), if known
+        self.stopped = False
+        for name, value in data.items():
+            setattr(self, name, value)
+
+    def stop_propagation(self):
+        """
+        No further listeners or on_* handlers see this event.
+        """
+        self.stopped = True
+
+    @property
+    def child(self):
+        node = self.target
+        while node is not None and node.parent is not self.current_target:
+            node = node.parent
+        return node
+
+    @property
+    def index(self):
+        # -1 when the event happened on current_target itself
+        child = self.child
+        if child is None: return -1
+        return child._index
+
+# Per-button event name prefixes: on_mouse_down, on_right_mouse_down, ...
+BUTTON_PREFIXES = {
+    glfw.MOUSE_BUTTON_LEFT: '',
+    glfw.MOUSE_BUTTON_RIGHT: 'right_',
+    glfw.MOUSE_BUTTON_MIDDLE: 'middle_',
+}
+
+# Queued event kind -> event type recorded for App.latency (moves aren't)
+LATENCY_TYPES = {'button': 'mouse_button', 'key': 'key', 'char': 'char', 'scroll': 'scroll'}
 
 class EventManager:
-    def __init__(self, window):
+    """
+    glfw callbacks append timestamped events to a queue; process_events
+    dispatches them in order once per frame. Consecutive cursor moves and
+    consecutive scrolls merge into one event, but every button, key and char
+    event is kept, so a press and release inside one slow frame still make a
+    click.
+    """
+    def __init__(self, window, max_events_per_frame=256):
         self.window = window
         self.hovered_element = None
         self.focused_element = None
         self.mouse_down_element = None
         
         # State
-        self.last_mouse_state = glfw.RELEASE
+        self.cursor = glfw.get_cursor_pos(window)
+        self.pressed = {}  # button -> element it went down on
+        
+        # Input queue: [type, time, ...]; leftovers beyond
+        # max_events_per_frame wait for the next frame
+        self.queue = []
+        self.max_events_per_frame = max_events_per_frame
+        
+        # Hit testing: App refreshes the index after each layout; the last
+        # result is reused while neither the cursor nor the index changed
+        self.hit_index = HitIndex()
+        self._hit_key = None
+        self._indexed_layout = None
+        self._hit_target = None
+        
+        # Set by every input callback; App redraws after input (take_activity)
+        self.activity = False
+        
+        # (event type, arrival time) of inputs dispatched since the last frame,
+        # for App.latency; event_time is the arrival time of the input being dispatched
+        self.input_times = []
+        self.event_time = None
         
         # Callbacks
         glfw.set_key_callback(self.window, self._on_key)
         glfw.set_char_callback(self.window, self._on_char)
         glfw.set_scroll_callback(self.window, self._on_scroll)
+        glfw.set_cursor_pos_callback(self.window, self._on_cursor_pos)
+        glfw.set_cursor_enter_callback(self.window, self._on_cursor_enter)
+        glfw.set_mouse_button_callback(self.window, self._on_mouse_button)
+
+    def take_activity(self):
+        activity = self.activity
+        self.activity = False
+        return activity
+
+    def take_input_times(self):
+        inputs = self.input_times
+        self.input_times = []
+        return inputs
+
+    # --- Callbacks (queue only, nothing is dispatched here) ---
+
+    def _on_cursor_pos(self, window, x, y):
+        self.activity = True
+        self.cursor = (x, y)
+        queue = self.queue
+        if queue and queue[-1][0] == 'move':
+            # Only the latest position matters until something else happens
+            queue[-1] = ['move', time.perf_counter(), x, y]
+        else:
+            queue.append(['move', time.perf_counter(), x, y])
+
+    def _on_cursor_enter(self, window, entered):
+        self.activity = True
+
+    def _on_mouse_button(self, window, button, action, mods):
+        self.activity = True
+        x, y = self.cursor
+        self.queue.append(['button', time.perf_counter(), button, action, mods, x, y])
 
     def _on_key(self, window, key, scancode, action, mods):
-        if self.focused_element:
-            # Dispatch to focused element
-            if action == glfw.PRESS:
-                self._dispatch(self.focused_element, 'on_keydown', key=key, mods=mods)
-            elif action == glfw.RELEASE:
-                self._dispatch(self.focused_element, 'on_keyup', key=key, mods=mods)
-            elif action == glfw.REPEAT:
-                self._dispatch(self.focused_element, 'on_keyrepeat', key=key, mods=mods)
+        self.activity = True
+        self.queue.append(['key', time.perf_counter(), key, action, mods])
 
     def _on_char(self, window, codepoint):
-        if self.focused_element:
-            self._dispatch(self.focused_element, 'on_char', codepoint=codepoint)
+        self.activity = True
+        self.queue.append(['char', time.perf_counter(), codepoint])
 
     def _on_scroll(self, window, xoffset, yoffset):
-        # Dispatch to hovered element first, then bubble up
-        target = self.hovered_element or self.focused_element
-        if target:
-            self._dispatch(target, 'on_scroll', dx=xoffset, dy=yoffset)
+        self.activity = True
+        queue = self.queue
+        if queue and queue[-1][0] == 'scroll':
+            # Wheel ticks within a frame add up; keep the first arrival time
+            queue[-1][2] += xoffset
+            queue[-1][3] += yoffset
+        else:
+            queue.append(['scroll', time.perf_counter(), xoffset, yoffset])
 
-    def process_events(self, root, overlays=None):
-        if not root and not overlays: return
+    # --- Dispatch ---
 
-        x, y = glfw.get_cursor_pos(self.window)
-        mouse_state = glfw.get_mouse_button(self.window, glfw.MOUSE_BUTTON_LEFT)
-        
-        # 1. Hit Test
-        target = None
-        
-        # Check overlays first (reverse order - top most first)
-        if overlays:
-            for overlay in reversed(overlays):
-                hit = self._hit_test(overlay, x, y)
-                if hit:
-                    target = hit
-                    break
-        
-        # If no overlay hit, check root
-        if not target and root:
-            target = self._hit_test(root, x, y)
-        
-        # 2. Hover Events
+    def update_hit_index(self, root, overlays=None):
+        # Re-index only after layout, the tree or a scroll offset changed
+        version = layout_version()
+        if version == self._indexed_layout: return
+        self._indexed_layout = version
+        self.hit_index.update([root] + list(overlays or []))
+
+    def _hit(self, x, y):
+        # Overlays are indexed above the root
+        hit_key = (x, y, self.hit_index.version)
+        if hit_key != self._hit_key:
+            self._hit_key = hit_key
+            self._hit_target = self.hit_index.hit(x, y)
+        return self._hit_target
+
+    def _update_hover(self, target):
         if target != self.hovered_element:
             # Mouse Leave
             if self.hovered_element:
@@ -68,68 +218,149 @@ class EventManager:
             if self.hovered_element:
                 self._dispatch(self.hovered_element, 'on_mouse_enter')
 
-        # Mouse Move
+    def process_events(self, root, overlays=None):
+        queue = self.queue
+        count = min(len(queue), self.max_events_per_frame)
+        events = queue[:count]
+        del queue[:count]
+        if queue:
+            # Budget used up: keep the loop going for the rest
+            self.activity = True
+        if not root and not overlays: return
+        
+        input_times = self.input_times
+        for event in events:
+            self.event_time = event[1]
+            kind = event[0]
+            latency_type = LATENCY_TYPES.get(kind)
+            if latency_type:
+                # Credited to the frame that dispatches it, not the one it
+                # arrived during: events over the budget wait a frame
+                input_times.append((latency_type, event[1]))
+            if kind == 'move':
+                self._handle_move(event[2], event[3])
+            elif kind == 'button':
+                self._handle_button(*event[2:])
+            elif kind == 'key':
+                self._handle_key(*event[2:])
+            elif kind == 'char':
+                if self.focused_element:
+                    self._dispatch(self.focused_element, 'on_char', codepoint=event[2])
+            elif kind == 'scroll':
+                # Dispatch to hovered element first, then bubble up
+                target = self.hovered_element or self.focused_element
+                if target:
+                    self._dispatch(target, 'on_scroll', dx=event[2], dy=event[3])
+        
+        # Layout may have moved elements under a still cursor
+        self._update_hover(self._hit(*self.cursor))
+
+    def _handle_move(self, x, y):
+        self._update_hover(self._hit(x, y))
+        
         # If we have a mouse_down_element (capture), dispatch to it
         if self.mouse_down_element:
             self._dispatch(self.mouse_down_element, 'on_mouse_move', x=x, y=y)
         elif self.hovered_element:
             self._dispatch(self.hovered_element, 'on_mouse_move', x=x, y=y)
 
-        # 3. Click Events
-        if mouse_state == glfw.PRESS and self.last_mouse_state == glfw.RELEASE:
-            # Mouse Down
-            self.mouse_down_element = target
+    def _handle_button(self, button, action, mods, x, y):
+        prefix = BUTTON_PREFIXES.get(button)
+        if prefix is None: return
+        target = self._hit(x, y)
+        self._update_hover(target)
+        
+        if action == glfw.PRESS:
+            self.pressed[button] = target
+            if button == glfw.MOUSE_BUTTON_LEFT:
+                # Left button captures moves and moves focus
+                self.mouse_down_element = target
+                if target != self.focused_element:
+                    if self.focused_element:
+                        self._dispatch(self.focused_element, 'on_blur')
+                    self.focused_element = target
+                    if self.focused_element:
+                        self._dispatch(self.focused_element, 'on_focus')
             
-            # Focus Management
-            if target != self.focused_element:
-                if self.focused_element:
-                    self._dispatch(self.focused_element, 'on_blur')
-                self.focused_element = target
-                if self.focused_element:
-                    self._dispatch(self.focused_element, 'on_focus')
-
             if target:
-                self._dispatch(target, 'on_mouse_down', x=x, y=y)
+                self._dispatch(target, f'on_{prefix}mouse_down', x=x, y=y)
         
-        elif mouse_state == glfw.RELEASE and self.last_mouse_state == glfw.PRESS:
-            # Mouse Up
+        elif action == glfw.RELEASE:
             if target:
-                self._dispatch(target, 'on_mouse_up')
+                self._dispatch(target, f'on_{prefix}mouse_up')
             
             # Click (if released on same element as down)
-            if target == self.mouse_down_element and target:
-                self._dispatch(target, 'on_click')
+            if target and self.pressed.get(button) is target:
+                self._dispatch(target, f'on_{prefix}click')
             
-            self.mouse_down_element = None
-
-        self.last_mouse_state = mouse_state
+            self.pressed.pop(button, None)
+            if button == glfw.MOUSE_BUTTON_LEFT:
+                self.mouse_down_element = None
 
-    def _hit_test(self, element, x, y):
-        # Check if point is within element bounds
-        b = element.computed_bounds
-        if not (b['x'] <= x <= b['x'] + b['w'] and b['y'] <= y <= b['y'] + b['h']):
-            return None
-        
-        # Check children in reverse order (top-most first)
-        for child in reversed(element.children):
-            hit = self._hit_test(child, x, y)
-            if hit:
-                return hit
-        
-        return element
+    def _handle_key(self, key, action, mods):
+        if not self.focused_element: return
+        # Dispatch to focused element
+        if action == glfw.PRESS:
+            self._dispatch(self.focused_element, 'on_keydown', key=key, mods=mods)
+        elif action == glfw.RELEASE:
+            self._dispatch(self.focused_element, 'on_keyup', key=key, mods=mods)
+        elif action == glfw.REPEAT:
+            self._dispatch(self.focused_element, 'on_keyrepeat', key=key, mods=mods)
 
     def _dispatch(self, element, event_name, **kwargs):
-        # Bubble up? For now, just call on target.
-        # If we want bubbling, we loop up via parent.
+        # Path from the target up to the root
+        path = []
+        listening = False
         curr = element
         while curr:
-            handler = getattr(curr, event_name, None)
-            if handler:
-                # Call handler, if it returns True, stop propagation?
-                # Or just call it.
-                handler(**kwargs)
-                break # For now, let's stop at first handler to avoid double handling? 
-                      # Actually, standard bubbling calls all. 
-                      # But let's keep it simple: if handled, stop?
-                      # Let's just call the specific handler on the target for now.
+            path.append(curr)
+            if curr._event_listeners:
+                listening = True
             curr = curr.parent
+        
+        # on_* handlers: only the nearest one runs, so a widget's own
+        # handler isn't repeated by its containers
+        if not listening:
+            for curr in path:
+                handler = getattr(curr, event_name, None)
+                if handler:
+                    call_handler(handler, **kwargs)
+                    break
+            return
+        
+        event = Event(event_name[3:], element, kwargs, self.event_time)
+        handled = False
+        
+        # Capture: root down to the target's parent
+        for curr in reversed(path[1:]):
+            if self._notify(curr, event, 'capture', True):
+                return
+        
+        # Target, then bubble back up
+        for curr in path:
+            phase = 'target' if curr is element else 'bubble'
+            if not handled:
+                handler = getattr(curr, event_name, None)
+                if handler:
+                    call_handler(handler, **kwargs)
+                    handled = True
+            if phase == 'target' and self._notify(curr, event, phase, True):
+                return
+            if self._notify(curr, event, phase, False):
+                return
+
+    def _notify(self, element, event, phase, capture):
+        """
+        Run element's listeners for the event; True if propagation stopped.
+        """
+        listeners = element._event_listeners
+        if not listeners: return False
+        listeners = listeners.get((event.type, capture))
+        if not listeners: return False
+        
+        event.current_target = element
+        event.phase = phase
+        # Copy: a listener may remove itself
+        for listener in list(listeners):
+            call_handler(listener, event)
+        return event.stopped
@@ -0,0 +1,119 @@
+import os
+import skia
+from .raster import record_frame, TiledRasterizer, DEFAULT_BACKGROUND, _deprecated_threads
+from .renderer import shared_renderer
+from .images import image_loader
+from .workers import spawn_pool
+
+def _format_for(path, format):
+    if format: return format.lower()
+    ext = os.path.splitext(path)[1].lower().lstrip('.')
+    if ext not in ('png', 'pdf'):
+        raise ValueError(f"Cannot tell the export format from '{path}'; pass format='png' or 'pdf'")
+    return ext
+
+def record_page(root, width, height, background=DEFAULT_BACKGROUND, max_passes=3):
+    """
+    Records an element tree as a skia.Picture like record_frame, but first
+    waits for its images to decode: images that finish loading change the
+    layout, so the tree is re-recorded until no more images arrive.
+    """
+    renderer = shared_renderer()
+    picture = None
+    for _ in range(max_passes):
+        picture = record_frame(root, width, height, renderer=renderer, background=background)
+        if not image_loader.wait():
+            break
+    return picture
+
+def export_png(root, path, width, height, background=DEFAULT_BACKGROUND, tiles=None, processes=None, threads=None):
+    """
+    Renders an element tree at width x height to a PNG file, without a window.
+    """
+    processes = _deprecated_threads(processes, threads)
+    picture = record_page(root, width, height, background)
+    with TiledRasterizer(tiles or 1, processes=processes if tiles else 1) as rasterizer:
+        image = rasterizer.rasterize(picture, width, height)
+
+    data = image.encodeToData(skia.kPNG, 100)
+    if data is None:
+        raise ValueError(f"Could not encode {path}")
+    with open(path, 'wb') as f:
+        f.write(bytes(data))
+    return path
+
+def export_pdf(roots, path, width, height, background=None, title=None):
+    """
+    Renders an element tree (or a list of them, one per page) to a vector
+    PDF through skia's document backend.
+    """
+    if not isinstance(roots, (list, tuple)):
+        roots = [roots]
+
+    metadata = {'Title': title} if title else {}
+    stream = skia.FILEWStream(path)
+    with skia.PDF.MakeDocument(stream, **metadata) as document:
+        for root in roots:
+            # Recorded commands play back into the PDF as vectors
+            picture = record_page(root, width, height, background)
+            with document.page(width, height) as canvas:
+                canvas.drawPicture(picture)
+    stream.flush()
+    return path
+
+def export(root, path, width, height, format=None, **kwargs):
+    """
+    Export to PNG or PDF, chosen by format or by the file extension.
+    """
+    if _format_for(path, format) == 'pdf':
+        return export_pdf(root, path, width, height, **kwargs)
+    return export_png(root, path, width, height, **kwargs)
+
+class ExportJob:
+    """
+    One page of a batch export. build(*args, **kwargs) is called in the
+    worker process to create the element tree, so it must be a module-level
+    function (element trees themselves are not picklable).
+    """
+    def __init__(self, build, path, width, height, args=(), kwargs=None, format=None):
+        self.build = build
+        self.path = path
+        self.width = width
+        self.height = height
+        self.args = args
+        self.kwargs = kwargs or {}
+        self.format = format
+
+def _init_worker(image_cache_bytes):
+    # Each worker keeps its own fonts (shared_renderer) and decoded images
+    # (image_cache) warm across all the jobs it runs
+    from .images import image_cache
+    if image_cache_bytes is not None:
+        image_cache.configure(budget_bytes=image_cache_bytes)
+    shared_renderer()
+
+def _run_job(job):
+    root = job.build(*job.args, **job.kwargs)
+    return export(root, job.path, job.width, job.height, format=job.format)
+
+def export_batch(jobs, processes=None, image_cache_bytes=None):
+    """
+    Runs ExportJobs across a process pool (one process per core by default).
+    Returns the output paths in job order; failed jobs give None and are
+    reported on stdout. Workers are spawned: scripts need an
+    `if __name__ == "__main__":` guard.
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return []
+
+    results = []
+    with spawn_pool(processes, _init_worker, (image_cache_bytes,)) as pool:
+        futures = [pool.submit(_run_job, job) for job in jobs]
+        for job, future in zip(jobs, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                print(f"Export failed for {job.path}: {e}")
+                results.append(None)
+    return results
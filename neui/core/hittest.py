@@ -0,0 +1,137 @@
+INF = float('inf')
+
+class HitIndex:
+    """
+    Uniform grid over the screen-space bounds of every element, so a hit
+    test only looks at the elements in the cursor's cell instead of walking
+    the tree.
+
+    An element's hit rect is its bounds, shifted by the scroll offsets of
+    its ancestors (ScrollView) and clipped to its ancestors' hit rects, as
+    the point must be inside every ancestor to reach it. Elements clipped
+    away entirely (e.g. rows scrolled out of view) are not indexed. The
+    topmost hit is the one drawn last: the highest pre-order position, with
+    overlays after the root.
+    """
+    def __init__(self, cell_size=32):
+        self.cell_size = cell_size
+        self.cells = {}    # (column, row) -> set of elements
+        self.entries = {}  # element -> (pre-order position, (x0, y0, x1, y1))
+        # Bumped whenever an update changes what a hit test can return
+        self.version = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def update(self, roots):
+        """
+        Re-derive hit rects after layout. Only elements whose rect changed,
+        appeared or disappeared touch the grid.
+        """
+        entries = {}
+        position = 0
+        stack = [(root, 0, 0, (-INF, -INF, INF, INF)) for root in reversed(roots) if root]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            element, dx, dy, clip = pop()
+            b = element.computed_bounds
+            # Runs after every layout, so min/max are inlined
+            x0 = b['x'] + dx
+            y0 = b['y'] + dy
+            x1 = x0 + b['w']
+            y1 = y0 + b['h']
+            cx0, cy0, cx1, cy1 = clip
+            if x0 < cx0: x0 = cx0
+            if y0 < cy0: y0 = cy0
+            if x1 > cx1: x1 = cx1
+            if y1 > cy1: y1 = cy1
+            if x0 > x1 or y0 > y1:
+                # Nothing in this subtree can be hit
+                continue
+            rect = (x0, y0, x1, y1)
+            entries[element] = (position, rect)
+            position += 1
+
+            children = element.children
+            if children:
+                # Children are drawn shifted by the element's own scroll offset
+                child_dx = dx - getattr(element, 'scroll_x', 0)
+                child_dy = dy - getattr(element, 'scroll_y', 0)
+                for child in reversed(children):
+                    push((child, child_dx, child_dy, rect))
+
+        changed = False
+        kept = 0
+        old_entries = self.entries
+        for element, (position, rect) in entries.items():
+            old = old_entries.get(element)
+            if old is None:
+                self._insert(element, rect)
+                changed = True
+                continue
+            kept += 1
+            if old[1] != rect:
+                self._remove(element, old[1])
+                self._insert(element, rect)
+                changed = True
+            elif old[0] != position:
+                changed = True
+
+        if kept < len(old_entries):
+            # Removed from the tree or clipped away
+            for element, (_, rect) in old_entries.items():
+                if element not in entries:
+                    self._remove(element, rect)
+            changed = True
+
+        self.entries = entries
+        if changed:
+            self.version += 1
+
+    def _cell_range(self, rect):
+        size = self.cell_size
+        x0, y0, x1, y1 = rect
+        return range(int(x0 // size), int(x1 // size) + 1), range(int(y0 // size), int(y1 // size) + 1)
+
+    def _insert(self, element, rect):
+        columns, rows = self._cell_range(rect)
+        for column in columns:
+            for row in rows:
+                cell = self.cells.get((column, row))
+                if cell is None:
+                    cell = self.cells[(column, row)] = set()
+                cell.add(element)
+
+    def _remove(self, element, rect):
+        columns, rows = self._cell_range(rect)
+        for column in columns:
+            for row in rows:
+                cell = self.cells.get((column, row))
+                if cell:
+                    cell.discard(element)
+                    if not cell:
+                        del self.cells[(column, row)]
+
+    def hit(self, x, y):
+        """
+        Topmost element under (x, y), or None.
+        """
+        size = self.cell_size
+        cell = self.cells.get((int(x // size), int(y // size)))
+        if not cell: return None
+
+        entries = self.entries
+        best = None
+        best_position = -1
+        for element in cell:
+            position, (x0, y0, x1, y1) = entries[element]
+            if position > best_position and x0 <= x <= x1 and y0 <= y <= y1:
+                best = element
+                best_position = position
+        return best
+
+    def clear(self):
+        self.cells = {}
+        self.entries = {}
+        self.version += 1
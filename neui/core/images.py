@@ -0,0 +1,266 @@
+import os
+import threading
+import skia
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
+
+def decode_image(src, size=None):
+    """
+    Reads and fully decodes an image file into a raster skia.Image.
+    skia.Image.open() decodes lazily on first draw; this forces it now.
+    
+    size: optional (w, h) to decode for. Larger images are downscaled once,
+    with mipmapped sampling, so only display-size pixels stay resident.
+    """
+    image = skia.Image.MakeFromEncoded(skia.Data.MakeFromFileName(src))
+    if image is None:
+        raise ValueError("unsupported or unreadable image")
+    
+    if size:
+        # Never upscale past the source
+        w, h = min(size[0], image.width()), min(size[1], image.height())
+        if w > 0 and h > 0 and (w, h) != (image.width(), image.height()):
+            surface = skia.Surface.MakeRasterN32Premul(w, h)
+            surface.getCanvas().drawImageRect(
+                image,
+                skia.Rect.MakeWH(w, h),
+                skia.SamplingOptions(skia.FilterMode.kLinear, skia.MipmapMode.kLinear)
+            )
+            return surface.makeImageSnapshot()
+    return image.makeRasterImage()
+
+def image_bytes(image):
+    return image.width() * image.height() * 4
+
+class _CacheEntry:
+    __slots__ = ('image', 'nbytes', 'refs')
+
+    def __init__(self, image):
+        self.image = image
+        self.nbytes = image_bytes(image)
+        self.refs = 0
+
+class ImageCache:
+    """
+    Process-wide cache of decoded images keyed by (path, mtime, target size).
+    Entries are reference counted by the elements showing them; unreferenced
+    entries are evicted least-recently-used first once the cache exceeds its
+    byte budget. Images still in use are never evicted.
+    """
+    def __init__(self, budget_bytes=256 * 1024 * 1024):
+        self.budget_bytes = budget_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(src, size=None):
+        # Raises OSError if the file doesn't exist
+        path = os.path.abspath(src)
+        return (path, os.stat(path).st_mtime_ns, size)
+
+    def configure(self, budget_bytes=None):
+        with self._lock:
+            if budget_bytes is not None:
+                self.budget_bytes = budget_bytes
+            self._evict()
+
+    def acquire(self, key):
+        """
+        Returns the cached image and takes a reference, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            entry.refs += 1
+            self._entries.move_to_end(key)
+            return entry.image
+
+    def put(self, key, image):
+        """
+        Inserts a decoded image (unless another decode got there first) and
+        takes a reference. Returns the cached image.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _CacheEntry(image)
+                self._entries[key] = entry
+                self.bytes += entry.nbytes
+            entry.refs += 1
+            self._entries.move_to_end(key)
+            self._evict()
+            return entry.image
+
+    def release(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None: return
+            entry.refs = max(0, entry.refs - 1)
+            if entry.refs == 0:
+                self._evict()
+
+    def _evict(self):
+        if self.bytes <= self.budget_bytes: return
+        for key in list(self._entries):
+            entry = self._entries[key]
+            if entry.refs: continue
+            del self._entries[key]
+            self.bytes -= entry.nbytes
+            self.evictions += 1
+            if self.bytes <= self.budget_bytes: break
+
+    def clear(self):
+        with self._lock:
+            for key in [k for k, e in self._entries.items() if not e.refs]:
+                self.bytes -= self._entries.pop(key).nbytes
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'entries': len(self._entries),
+                'bytes': self.bytes,
+                'budget_bytes': self.budget_bytes,
+            }
+
+class LoadRequest:
+    def __init__(self, key, callback):
+        self.key = key
+        self.callback = callback
+        self.cancelled = False
+        self._pending = None
+
+    def cancel(self):
+        # Not started yet: never runs. Already decoding: result is dropped.
+        self.cancelled = True
+        pending = self._pending
+        if pending and all(r.cancelled for r in pending.requests) and pending.future.cancel():
+            # Never started, so poll() won't see it: drop it here
+            pending.loader._forget(pending)
+
+class _PendingDecode:
+    def __init__(self, key, loader):
+        self.key = key
+        self.loader = loader
+        self.requests = []
+        self.future = None
+
+class ImageLoader:
+    """
+    Decodes images on a thread pool into the shared image_cache. Requests for
+    a key that is already being decoded join that decode. Results are queued
+    and handed back to their callbacks on the UI thread by poll(), which
+    App.run calls every frame.
+    """
+    def __init__(self, cache, max_workers=4, cancel_on_remove=True):
+        self.cache = cache
+        self.max_workers = max_workers
+        self.cancel_on_remove = cancel_on_remove
+        self._pool = None
+        self._pending = {}
+        self._completed = deque()
+        # Called from the worker thread after each decode (App sets it to
+        # wake its event loop)
+        self.wake = None
+
+    def configure(self, max_workers=None, cancel_on_remove=None):
+        if max_workers is not None and max_workers != self.max_workers:
+            self.max_workers = max_workers
+            # Pending decodes on the old pool still finish
+            if self._pool:
+                self._pool.shutdown(wait=False)
+                self._pool = None
+        if cancel_on_remove is not None:
+            self.cancel_on_remove = cancel_on_remove
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='neui-image')
+        return self._pool
+
+    def load(self, key, callback):
+        """
+        Decode the image for a cache key in the background. callback(image,
+        error) runs on the UI thread; a delivered image holds one cache
+        reference. Returns a LoadRequest that can be cancelled.
+        """
+        request = LoadRequest(key, callback)
+        pending = self._pending.get(key)
+        if pending is None or pending.future.cancelled():
+            pending = _PendingDecode(key, self)
+            pending.future = self._get_pool().submit(self._decode, pending)
+            self._pending[key] = pending
+        pending.requests.append(request)
+        request._pending = pending
+        return request
+
+    def _decode(self, pending):
+        from .thumbnails import thumbnail_cache
+        try:
+            path, _, size = pending.key
+            if size and thumbnail_cache.enabled:
+                # Display-size decodes go through the on-disk thumbnail cache
+                image, error = thumbnail_cache.load(path, size), None
+            else:
+                image, error = decode_image(path, size), None
+        except Exception as e:
+            image, error = None, e
+        # deque.append is thread-safe
+        self._completed.append((pending, image, error))
+        wake = self.wake
+        if wake:
+            wake()
+
+    def poll(self):
+        """
+        Deliver finished decodes. Returns True if any callback ran.
+        """
+        delivered = False
+        while self._completed:
+            pending, image, error = self._completed.popleft()
+            self._forget(pending)
+            
+            live = [r for r in pending.requests if not r.cancelled]
+            if image is not None and not live:
+                # Everyone went away; keep it cached but unreferenced
+                self.cache.put(pending.key, image)
+                self.cache.release(pending.key)
+            for request in live:
+                cached = self.cache.put(pending.key, image) if image is not None else None
+                request.callback(cached, error)
+                delivered = True
+        return delivered
+
+    def _forget(self, pending):
+        if self._pending.get(pending.key) is pending:
+            del self._pending[pending.key]
+
+    def wait(self, timeout=None):
+        """
+        Block until every in-flight decode has finished, then deliver them.
+        For headless rendering; the UI loop uses poll().
+        """
+        futures = [p.future for p in self._pending.values() if not p.future.cancelled()]
+        if futures:
+            wait_futures(futures, timeout)
+        return self.poll()
+
+    def shutdown(self):
+        if self._pool:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+# Global instances
+image_cache = ImageCache()
+image_loader = ImageLoader(image_cache)
@@ -1,3 +1,28 @@
+# Bumped whenever a layout pass moves or resizes an element, an element is
+# added or removed, or a ScrollView scrolls: anything that can change what
+# is under the cursor. Hit testing re-indexes only when it moves.
+_layout_version = 0
+
+def layout_version():
+    return _layout_version
+
+def touch_layout():
+    global _layout_version
+    _layout_version += 1
+
+# > 0 while _measure_element dry-runs a subtree at (0, 0)
+_measuring = 0
+
+def _set_bounds(element, x, y, w, h):
+    element.computed_bounds = {'x': x, 'y': y, 'w': w, 'h': h}
+    if _measuring: return
+    # Final placement: compare with where the last pass left the element,
+    # as the measure pass has just overwritten computed_bounds
+    placed = (x, y, w, h)
+    if element._placed != placed:
+        element._placed = placed
+        touch_layout()
+
 def compute_layout(element, parent_w, parent_h, parent_x=0, parent_y=0):
     """
     Recursive layout engine.
@@ -205,7 +230,7 @@ def compute_layout(element, parent_w, parent_h, parent_x=0, parent_y=0):
             compute_layout(child, cw, ch, final_x, final_y)
 
     # Finalize Own Bounds
-    element.computed_bounds = {'x': parent_x, 'y': parent_y, 'w': w, 'h': h}
+    _set_bounds(element, parent_x, parent_y, w, h)
 
 def _resolve_dim(val, parent_val):
     if val is None: return None
@@ -236,7 +261,12 @@ def _measure_element(element, parent_w, parent_h):
     
     # Save current bounds? No need, we are in a measure pass.
     
-    compute_layout(element, parent_w, parent_h, 0, 0)
+    global _measuring
+    _measuring += 1
+    try:
+        compute_layout(element, parent_w, parent_h, 0, 0)
+    finally:
+        _measuring -= 1
     b = element.computed_bounds
     return b['w'], b['h']
 
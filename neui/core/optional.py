@@ -0,0 +1,18 @@
+def optional_numpy():
+    """
+    numpy if it is installed, else None.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+def require_numpy(feature):
+    """
+    numpy, or an ImportError naming the feature that needs it.
+    """
+    numpy = optional_numpy()
+    if numpy is None:
+        raise ImportError(f"{feature} requires numpy (pip install neui[numpy])")
+    return numpy
@@ -0,0 +1,100 @@
+import queue
+import threading
+import time
+import glfw
+
+def frames_in_flight(app):
+    """
+    How many frames may still read pixels an element drew, counting the one
+    being recorded: with App(pipelined=True) also up to pipeline_depth
+    queued frames and the one the render thread is presenting.
+    """
+    if app and app._render_thread:
+        return app.pipeline_depth + 2
+    return 1
+
+class RenderThread(threading.Thread):
+    """
+    Rasterizes and presents recorded frames (skia.Picture) on a dedicated
+    thread that owns the GL context, so the main thread can process events,
+    layout and record frame N while frame N-1 is flushed and swapped.
+    """
+    def __init__(self, window, context, make_surface, depth=1, swap_interval=1):
+        super().__init__(name='neui-render', daemon=True)
+        self.window = window
+        self.swap_interval = swap_interval
+        # Set from the main thread, applied by this thread before its next swap
+        self._pending_interval = None
+        self.context = context
+        self.make_surface = make_surface
+
+        # Bounded queue: the main thread blocks once `depth` frames are waiting
+        self.frames = queue.Queue(maxsize=max(1, min(2, depth)))
+        self.error = None
+
+        self.surface = None
+        self._size = None
+
+    def submit(self, picture, width, height, on_present=None):
+        """
+        on_present(time) is called on this thread right after the frame's
+        swap_buffers.
+        """
+        if self.error:
+            raise RuntimeError("Render thread failed") from self.error
+        while True:
+            try:
+                self.frames.put((picture, width, height, on_present), timeout=0.1)
+                return
+            except queue.Full:
+                # Render thread may have died while we were waiting
+                if not self.is_alive():
+                    raise RuntimeError("Render thread stopped") from self.error
+
+    def set_swap_interval(self, interval):
+        """
+        Change the swap interval (vsync) from any thread; glfw.swap_interval
+        must run on the thread whose context is current, so it is applied
+        before the next frame is presented.
+        """
+        self.swap_interval = interval
+        self._pending_interval = interval
+
+    def run(self):
+        glfw.make_context_current(self.window)
+        glfw.swap_interval(self.swap_interval)
+        try:
+            while True:
+                frame = self.frames.get()
+                if frame is None: break
+                interval = self._pending_interval
+                if interval is not None:
+                    self._pending_interval = None
+                    glfw.swap_interval(interval)
+                self._present(*frame)
+        except Exception as e:
+            self.error = e
+            print(f"Render thread error: {e}")
+        finally:
+            self.surface = None
+            glfw.make_context_current(None)
+
+    def _present(self, picture, width, height, on_present=None):
+        # Window was resized since the last frame: recreate the surface here,
+        # the GL context is only ever used from this thread.
+        if self._size != (width, height):
+            self.surface = self.make_surface(self.context, width, height)
+            self._size = (width, height)
+        if not self.surface: return
+
+        canvas = self.surface.getCanvas()
+        canvas.drawPicture(picture)
+        self.surface.flushAndSubmit()
+        glfw.swap_buffers(self.window)
+        if on_present:
+            on_present(time.perf_counter())
+
+    def stop(self):
+        if self.is_alive():
+            self.frames.put(None)
+            self.join()
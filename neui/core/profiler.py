@@ -0,0 +1,177 @@
+import json
+import os
+import time
+from collections import deque
+
+class _Frame:
+    __slots__ = ('index', 'start', 'end', 'phases', 'elements')
+
+    def __init__(self, index, start):
+        self.index = index
+        self.start = start
+        self.end = start
+        self.phases = []    # (name, start, end)
+        self.elements = {}  # (type name, 'layout'|'render') -> seconds
+
+class FrameProfiler:
+    """
+    Timestamps the phases of each App.run iteration that renders a frame
+    (timers, events, animation, images, layout, render, present) and keeps
+    the last `max_frames` in a ring buffer. With by_element=True, measure()
+    and render() of every element class are wrapped to break layout and
+    render time down by element type (self time, children excluded).
+
+    Disabled by default; the loop only checks one attribute per phase.
+    """
+    def __init__(self, max_frames=300):
+        self.enabled = False
+        self.by_element = False
+        self.frames = deque(maxlen=max_frames)
+        self._frame = None
+        self._last = 0.0
+        self._index = 0
+
+        # Element method patching (by_element)
+        self._patched = {}  # (class, method name) -> original function
+        self._stack = []
+
+    def enable(self, by_element=False):
+        self.enabled = True
+        self.by_element = by_element
+        if by_element:
+            self._patch_elements()
+
+    def disable(self):
+        self.enabled = False
+        self._frame = None
+        self._unpatch_elements()
+
+    def clear(self):
+        self.frames.clear()
+
+    # --- Recording (called by App) ---
+
+    def begin_frame(self):
+        if self.by_element:
+            # Widget modules are imported lazily; catch classes loaded since
+            self._patch_elements()
+        now = time.perf_counter()
+        self._frame = _Frame(self._index, now)
+        self._last = now
+
+    def mark(self, phase):
+        """
+        End the current phase: it ran from the previous mark until now.
+        """
+        now = time.perf_counter()
+        if self._frame:
+            self._frame.phases.append((phase, self._last, now))
+        self._last = now
+
+    def discard_frame(self):
+        # Iteration that didn't render: nothing worth keeping
+        self._frame = None
+
+    def end_frame(self):
+        frame = self._frame
+        if not frame: return
+        frame.end = time.perf_counter()
+        self.frames.append(frame)
+        self._index += 1
+        self._frame = None
+
+    # --- Per element type ---
+
+    def _patch_elements(self):
+        from ..ui.element import Element
+        classes = [Element]
+        while classes:
+            cls = classes.pop()
+            classes.extend(cls.__subclasses__())
+            for method, kind in (('render', 'render'), ('measure', 'layout')):
+                original = cls.__dict__.get(method)
+                if original is None or (cls, method) in self._patched: continue
+                self._patched[(cls, method)] = original
+                setattr(cls, method, self._timed(original, kind))
+
+    def _unpatch_elements(self):
+        for (cls, method), original in self._patched.items():
+            setattr(cls, method, original)
+        self._patched = {}
+        self._stack = []
+
+    def _timed(self, original, kind):
+        profiler = self
+        def timed(element, *args, **kwargs):
+            stack = profiler._stack
+            stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                return original(element, *args, **kwargs)
+            finally:
+                total = time.perf_counter() - start
+                children = stack.pop()
+                if stack:
+                    stack[-1] += total
+                frame = profiler._frame
+                if frame:
+                    # super() calls land here too and add up under the concrete type
+                    key = (type(element).__name__, kind)
+                    frame.elements[key] = frame.elements.get(key, 0.0) + total - children
+        timed.__name__ = original.__name__
+        timed.__wrapped__ = original
+        return timed
+
+    # --- Reporting ---
+
+    def summary(self):
+        """
+        Mean milliseconds per frame for each phase and, if recorded, for
+        each (element type, layout|render) over the buffered frames.
+        """
+        count = len(self.frames)
+        if not count:
+            return {'frames': 0, 'phases': {}, 'elements': {}}
+        phases = {}
+        elements = {}
+        total = 0.0
+        for frame in self.frames:
+            total += frame.end - frame.start
+            for name, start, end in frame.phases:
+                phases[name] = phases.get(name, 0.0) + (end - start)
+            for key, seconds in frame.elements.items():
+                elements[key] = elements.get(key, 0.0) + seconds
+        return {
+            'frames': count,
+            'frame_ms': total / count * 1000,
+            'phases': {name: seconds / count * 1000 for name, seconds in phases.items()},
+            'elements': {f"{name}.{kind}": seconds / count * 1000
+                         for (name, kind), seconds in sorted(elements.items(), key=lambda item: -item[1])},
+        }
+
+    def export_chrome_trace(self, path):
+        """
+        Write the buffered frames as Chrome trace-event JSON (open in
+        https://ui.perfetto.dev or chrome://tracing).
+        """
+        pid = os.getpid()
+        events = [
+            {'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 1, 'args': {'name': 'neui'}},
+            {'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': 1, 'args': {'name': 'main loop'}},
+        ]
+        for frame in self.frames:
+            args = {f"{name}.{kind}_ms": round(seconds * 1000, 3)
+                    for (name, kind), seconds in frame.elements.items()}
+            events.append({
+                'name': f"frame {frame.index}", 'cat': 'frame', 'ph': 'X', 'pid': pid, 'tid': 1,
+                'ts': frame.start * 1e6, 'dur': (frame.end - frame.start) * 1e6, 'args': args,
+            })
+            for name, start, end in frame.phases:
+                events.append({
+                    'name': name, 'cat': 'phase', 'ph': 'X', 'pid': pid, 'tid': 1,
+                    'ts': start * 1e6, 'dur': (end - start) * 1e6,
+                })
+
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+        return path
@@ -0,0 +1,74 @@
+from collections import deque
+
+class QualitySettings:
+    """
+    Effects the Renderer (and Text wrapping) may drop under frame pressure.
+    All enabled means full quality.
+    """
+    def __init__(self):
+        self.shadow_blur = True   # Blurred drop shadows (MaskFilter)
+        self.antialias = True     # Antialiased rect fills and borders
+        self.text_rewrap = True   # Re-wrap text when its width changes
+
+class QualityGovernor:
+    """
+    Watches recent frame times and degrades effects one level at a time
+    while frames exceed the budget, then restores them once frames have
+    been comfortably inside the budget for a while.
+
+    level 0 is full quality; level N disables the first N effects.
+    """
+    DEFAULT_EFFECTS = ('shadow_blur', 'antialias', 'text_rewrap')
+
+    def __init__(self, settings, budget_ms=16.7, effects=None, window=8, recover_frames=60, recover_ratio=0.6):
+        self.settings = settings
+        self.budget = budget_ms / 1000.0
+        self.effects = tuple(effects) if effects is not None else self.DEFAULT_EFFECTS
+        self.recover_frames = recover_frames
+        self.recover_ratio = recover_ratio
+
+        self.frame_times = deque(maxlen=window)
+        self.level = 0
+        self._calm_frames = 0
+
+    @property
+    def max_level(self):
+        return len(self.effects)
+
+    def record(self, frame_time):
+        """
+        Feed one frame time (seconds). Returns True if the level changed.
+        """
+        self.frame_times.append(frame_time)
+        if len(self.frame_times) < self.frame_times.maxlen:
+            return False
+
+        average = sum(self.frame_times) / len(self.frame_times)
+
+        if average > self.budget:
+            self._calm_frames = 0
+            if self.level < self.max_level:
+                # Start a fresh window so the next step reflects this level
+                self.frame_times.clear()
+                self._set_level(self.level + 1)
+                return True
+        elif average < self.budget * self.recover_ratio:
+            self._calm_frames += 1
+            if self.level > 0 and self._calm_frames >= self.recover_frames:
+                self._calm_frames = 0
+                self.frame_times.clear()
+                self._set_level(self.level - 1)
+                return True
+        else:
+            self._calm_frames = 0
+        return False
+
+    def _set_level(self, level):
+        self.level = level
+        for i, effect in enumerate(self.effects):
+            setattr(self.settings, effect, i >= level)
+
+    def reset(self):
+        self.frame_times.clear()
+        self._calm_frames = 0
+        self._set_level(0)
@@ -0,0 +1,137 @@
+import os
+import warnings
+import skia
+from .workers import spawn_pool
+from .layout import compute_layout
+from .renderer import Renderer
+from .images import image_loader
+
+DEFAULT_BACKGROUND = skia.Color(30, 30, 30)
+
+def record_frame(root, width, height, overlays=(), renderer=None, background=DEFAULT_BACKGROUND):
+    """
+    Lays out an element tree at width x height and records its draw
+    commands into a skia.Picture. Nothing is rasterized here.
+    """
+    renderer = renderer or Renderer()
+    image_loader.poll()
+
+    if root:
+        root.computed_bounds = {'x': 0, 'y': 0, 'w': width, 'h': height}
+        compute_layout(root, width, height)
+    for overlay in overlays:
+        overlay.computed_bounds = {'x': 0, 'y': 0, 'w': width, 'h': height}
+        compute_layout(overlay, width, height)
+
+    recorder = skia.PictureRecorder()
+    canvas = recorder.beginRecording(skia.Rect.MakeWH(width, height))
+    if background is not None:
+        canvas.clear(background)
+    if root:
+        root.render(canvas, renderer)
+    for overlay in overlays:
+        overlay.render(canvas, renderer)
+    renderer.flush(canvas)
+    return recorder.finishRecordingAsPicture()
+
+def _rasterize_tile(picture, x, y, w, h):
+    surface = skia.Surface.MakeRasterN32Premul(w, h)
+    canvas = surface.getCanvas()
+    canvas.clipRect(skia.Rect.MakeWH(w, h))
+    canvas.translate(-x, -y)
+    canvas.drawPicture(picture)
+    return surface.makeImageSnapshot()
+
+def _rasterize_tiles(data, rects):
+    # Runs in a worker process: the picture arrives serialized, pixels go back
+    picture = skia.Picture.MakeFromData(skia.Data.MakeWithCopy(data))
+    return [_rasterize_tile(picture, *rect).tobytes() for rect in rects]
+
+def _deprecated_threads(processes, threads):
+    # threads= was renamed to processes= when tiles moved to worker processes
+    if threads is None:
+        return processes
+    warnings.warn("threads= is deprecated, use processes=", DeprecationWarning, stacklevel=3)
+    return processes if processes is not None else threads
+
+class TiledRasterizer:
+    """
+    Rasterizes a recorded Picture on the CPU by splitting the target into
+    tiles and playing the picture back into each tile. With processes > 1
+    the picture is serialized once per call and the tiles are split across
+    a process pool, which returns their pixels; playback doesn't depend on
+    the skia binding releasing the GIL. Copying the pixels back costs time
+    in proportion to the target size, so it only pays off on several cores.
+    Workers are spawned: scripts need an `if __name__ == "__main__":` guard.
+    """
+    def __init__(self, tiles=4, processes=None, threads=None):
+        # tiles: N for an N x N grid, or (cols, rows); threads is a deprecated alias of processes
+        processes = _deprecated_threads(processes, threads)
+        if isinstance(tiles, int):
+            tiles = (tiles, tiles)
+        self.cols, self.rows = max(1, tiles[0]), max(1, tiles[1])
+        self.processes = processes or os.cpu_count() or 1
+        self._pool = None
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = spawn_pool(self.processes)
+        return self._pool
+
+    def _tile_rects(self, width, height):
+        rects = []
+        tile_w = -(-width // self.cols)
+        tile_h = -(-height // self.rows)
+        for row in range(self.rows):
+            for col in range(self.cols):
+                x, y = col * tile_w, row * tile_h
+                w, h = min(tile_w, width - x), min(tile_h, height - y)
+                if w > 0 and h > 0:
+                    rects.append((x, y, w, h))
+        return rects
+
+    def rasterize(self, picture, width, height):
+        """
+        Returns a skia.Image of the picture rasterized at width x height.
+        """
+        width, height = int(width), int(height)
+        rects = self._tile_rects(width, height)
+
+        surface = skia.Surface.MakeRasterN32Premul(width, height)
+        canvas = surface.getCanvas()
+        if len(rects) == 1 or self.processes == 1:
+            for x, y, w, h in rects:
+                canvas.drawImage(_rasterize_tile(picture, x, y, w, h), x, y)
+            return surface.makeImageSnapshot()
+
+        # One task per worker, so each deserializes the picture once
+        data = bytes(picture.serialize())
+        chunks = [rects[i::self.processes] for i in range(min(self.processes, len(rects)))]
+        pool = self._get_pool()
+        futures = [pool.submit(_rasterize_tiles, data, chunk) for chunk in chunks]
+        for chunk, future in zip(chunks, futures):
+            # Copy the returned pixels straight into the target
+            for (x, y, w, h), pixels in zip(chunk, future.result()):
+                canvas.writePixels(skia.ImageInfo.MakeN32Premul(w, h), pixels, w * 4, x, y)
+        return surface.makeImageSnapshot()
+
+    def close(self):
+        if self._pool:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+def render_to_image(root, width, height, overlays=(), tiles=None, processes=None, renderer=None, threads=None):
+    """
+    Headless render of an element tree into a skia.Image, without a window.
+    Pass tiles/processes to rasterize on several cores.
+    """
+    processes = _deprecated_threads(processes, threads)
+    picture = record_frame(root, width, height, overlays, renderer)
+    with TiledRasterizer(tiles or 1, processes=processes if tiles else 1) as rasterizer:
+        return rasterizer.rasterize(picture, width, height)
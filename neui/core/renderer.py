@@ -1,9 +1,37 @@
 import skia
+from .quality import QualitySettings
+from .batch import DrawBatcher
 
 class Renderer:
-    def __init__(self):
+    def __init__(self, batching=False):
         self.default_typeface = skia.Typeface('Arial')
         self.default_font = skia.Font(self.default_typeface, 14)
+        
+        # Effects that may be degraded by App's QualityGovernor
+        self.quality = QualitySettings()
+        
+        # Optional batching of repeated primitives (see batch.py)
+        self.batcher = DrawBatcher() if batching else None
+        self.draw_calls = 0
+        self._paints = {}
+        self._fonts = {}
+
+    def _direct(self, canvas, l, t, r, b):
+        """
+        Called before drawing straight to the canvas. Pending batches that
+        the new draw overlaps must hit the canvas first to keep z-order.
+        """
+        if self.batcher:
+            self.draw_calls += self.batcher.flush_under(canvas, l, t, r, b)
+        self.draw_calls += 1
+
+    def flush(self, canvas):
+        """
+        Draws any batched primitives. Call at the end of every frame, and
+        before drawing to the canvas directly while batching is enabled.
+        """
+        if self.batcher:
+            self.draw_calls += self.batcher.flush(canvas)
 
     def draw_rect(self, canvas, rect, style):
         """
@@ -17,44 +45,107 @@ class Renderer:
         # Draw Shadow
         if 'shadow' in style:
             shadow_blur = style['shadow']
-            shadow_paint = skia.Paint(
-                Color=skia.Color(0, 0, 0, 100),
-                AntiAlias=True,
-                MaskFilter=skia.MaskFilter.MakeBlur(skia.kNormal_BlurStyle, shadow_blur)
-            )
+            if self.quality.shadow_blur:
+                shadow_paint = skia.Paint(
+                    Color=skia.Color(0, 0, 0, 100),
+                    AntiAlias=True,
+                    MaskFilter=skia.MaskFilter.MakeBlur(skia.kNormal_BlurStyle, shadow_blur)
+                )
+            else:
+                # Degraded: flat, lighter shadow without the blur pass
+                shadow_paint = skia.Paint(Color=skia.Color(0, 0, 0, 60), AntiAlias=self.quality.antialias)
             shadow_rect = skia.Rect.MakeXYWH(x + 2, y + 2, w, h)
+            spread = shadow_blur * 3
+            self._direct(canvas, x + 2 - spread, y + 2 - spread, x + 2 + w + spread, y + 2 + h + spread)
             if radius > 0:
                 canvas.drawRRect(skia.RRect.MakeRectXY(shadow_rect, radius, radius), shadow_paint)
             else:
                 canvas.drawRect(shadow_rect, shadow_paint)
 
+        rect = {'x': x, 'y': y, 'w': w, 'h': h}
+
         # Draw Background
         if 'bg' in style:
-            bg_color = self._parse_color(style['bg'])
-            paint = skia.Paint(Color=bg_color, AntiAlias=True)
-            
-            if radius > 0:
-                rrect = skia.RRect.MakeRectXY(skia.Rect.MakeXYWH(x, y, w, h), radius, radius)
-                canvas.drawRRect(rrect, paint)
-            else:
-                canvas.drawRect(skia.Rect.MakeXYWH(x, y, w, h), paint)
+            self.fill_rect(canvas, rect, self._parse_color(style['bg']), radius)
 
         # Draw Border
         if 'border_color' in style:
-            border_color = self._parse_color(style['border_color'])
-            border_width = style.get('border_width', 1)
-            paint = skia.Paint(
-                Color=border_color, 
-                AntiAlias=True,
-                Style=skia.Paint.kStroke_Style,
-                StrokeWidth=border_width
-            )
-            
-            if radius > 0:
-                rrect = skia.RRect.MakeRectXY(skia.Rect.MakeXYWH(x, y, w, h), radius, radius)
-                canvas.drawRRect(rrect, paint)
-            else:
-                canvas.drawRect(skia.Rect.MakeXYWH(x, y, w, h), paint)
+            self.stroke_rect(canvas, rect, self._parse_color(style['border_color']), style.get('border_width', 1), radius)
+
+    def fill_rect(self, canvas, rect, color, radius=0, antialias=True):
+        """
+        Fills a (rounded) rectangle with a solid skia color.
+        """
+        x, y, w, h = rect['x'], rect['y'], rect['w'], rect['h']
+        if self.batcher:
+            if radius <= 0:
+                self.batcher.add_rect(x, y, w, h, color)
+                return
+            if self.batcher.add_shape('rrect', x, y, w, h, color, radius):
+                return
+            self._direct(canvas, x - 1, y - 1, x + w + 1, y + h + 1)
+        else:
+            self.draw_calls += 1
+        paint = self._paint(color, antialias and self.quality.antialias)
+        if radius > 0:
+            canvas.drawRRect(skia.RRect.MakeRectXY(skia.Rect.MakeXYWH(x, y, w, h), radius, radius), paint)
+        else:
+            canvas.drawRect(skia.Rect.MakeXYWH(x, y, w, h), paint)
+
+    def stroke_rect(self, canvas, rect, color, width=1, radius=0):
+        x, y, w, h = rect['x'], rect['y'], rect['w'], rect['h']
+        if self.batcher:
+            if self.batcher.add_shape('rrect', x, y, w, h, color, radius, stroke=width):
+                return
+            pad = width / 2 + 1
+            self._direct(canvas, x - pad, y - pad, x + w + pad, y + h + pad)
+        else:
+            self.draw_calls += 1
+        paint = self._paint(color, self.quality.antialias, stroke=width)
+        if radius > 0:
+            canvas.drawRRect(skia.RRect.MakeRectXY(skia.Rect.MakeXYWH(x, y, w, h), radius, radius), paint)
+        else:
+            canvas.drawRect(skia.Rect.MakeXYWH(x, y, w, h), paint)
+
+    def fill_circle(self, canvas, cx, cy, radius, color):
+        if self.batcher:
+            if self.batcher.add_shape('oval', cx - radius, cy - radius, radius * 2, radius * 2, color):
+                return
+            self._direct(canvas, cx - radius - 1, cy - radius - 1, cx + radius + 1, cy + radius + 1)
+        else:
+            self.draw_calls += 1
+        canvas.drawCircle(cx, cy, radius, self._paint(color))
+
+    def draw_path(self, canvas, path, paint):
+        if self.batcher:
+            if self.batcher.add_path(path, paint):
+                return
+            b = path.computeTightBounds()
+            pad = paint.getStrokeWidth() / 2 + 1
+            self._direct(canvas, b.left() - pad, b.top() - pad, b.right() + pad, b.bottom() + pad)
+        else:
+            self.draw_calls += 1
+        canvas.drawPath(path, paint)
+
+    def _font(self, size):
+        font = self._fonts.get(size)
+        if font is None:
+            font = self._fonts[size] = skia.Font(self.default_typeface, size)
+        return font
+
+    def _paint(self, color, antialias=True, stroke=0):
+        # Reuse paints instead of allocating one per primitive per frame
+        key = (color, antialias, stroke)
+        paint = self._paints.get(key)
+        if paint is None:
+            paint = skia.Paint(Color=color, AntiAlias=antialias)
+            if stroke:
+                paint.setStyle(skia.Paint.kStroke_Style)
+                paint.setStrokeWidth(stroke)
+            if len(self._paints) > 256:
+                self._paints.clear()
+            self._paints[key] = paint
+        return paint
 
     def draw_text(self, canvas, text, x, y, style):
         """
@@ -65,29 +156,37 @@ class Renderer:
         
         # Font handling
         font_size = style.get('font_size', 14)
-        font = skia.Font(self.default_typeface, font_size)
+        font = self._font(font_size)
         
         # Draw text (Skia draws from baseline, so we might need adjustment if x,y is top-left)
         # For now assuming simple baseline drawing or that layout handles it.
         # But typically we want to draw at x, y+ascent.
         # Let's stick to simple drawing for now as per previous working version.
+        if self.batcher:
+            self._direct(canvas, x, y, x + font.measureText(text), y + font_size * 1.5)
+        else:
+            self.draw_calls += 1
         canvas.drawString(text, x, y + font_size, font, paint)
 
     def measure_text(self, text, style):
         font_size = style.get('font_size', 14)
-        font = skia.Font(self.default_typeface, font_size)
+        font = self._font(font_size)
         width = font.measureText(text)
         metrics = font.getMetrics()
         height = -metrics.fAscent + metrics.fDescent
         return width, height
 
-    def draw_image(self, canvas, image, rect, style):
+    def draw_image(self, canvas, image, rect, style, src=None):
+        """
+        Draws image (or its src sub-rect) into rect.
+        style['sampling']: 'nearest', 'linear' or unset (automatic).
+        """
         if not image: return
         
         # Ensure floats
-        w = float(image.width())
-        h = float(image.height())
-        src_rect = skia.Rect.MakeWH(w, h)
+        src_rect = src if src is not None else skia.Rect.MakeWH(float(image.width()), float(image.height()))
+        w = src_rect.width()
+        h = src_rect.height()
         
         dx = float(rect['x'])
         dy = float(rect['y'])
@@ -95,20 +194,40 @@ class Renderer:
         dh = float(rect['h'])
         dst_rect = skia.Rect.MakeXYWH(dx, dy, dw, dh)
         
-        # Try without paint first
-        # Try without paint first
-        canvas.drawImageRect(image, src_rect, dst_rect)
+        mode = style.get('sampling')
+        if mode == 'nearest':
+            sampling = skia.SamplingOptions(skia.FilterMode.kNearest)
+        elif dw < w or dh < h:
+            # Drawing smaller than the source: sample from mipmaps instead of
+            # aliasing through the full-resolution pixels every frame
+            sampling = skia.SamplingOptions(skia.FilterMode.kLinear, skia.MipmapMode.kLinear)
+        else:
+            sampling = skia.SamplingOptions(skia.FilterMode.kLinear)
+        
+        self._direct(canvas, dx, dy, dx + dw, dy + dh)
+        if src is None:
+            canvas.drawImageRect(image, src_rect, dst_rect, sampling)
+        else:
+            # Let filtering read just outside src (e.g. a tile's apron)
+            canvas.drawImageRect(image, src_rect, dst_rect, sampling, None, skia.Canvas.kFast_SrcRectConstraint)
 
     def save(self, canvas):
+        self.flush(canvas)
         return canvas.save()
 
     def restore(self, canvas):
+        self.flush(canvas)
         canvas.restore()
 
+    def translate(self, canvas, dx, dy):
+        self.flush(canvas)
+        canvas.translate(dx, dy)
+
     def clip_rect(self, canvas, rect):
         """
         rect: {'x': float, 'y': float, 'w': float, 'h': float}
         """
+        self.flush(canvas)
         skia_rect = skia.Rect.MakeXYWH(rect['x'], rect['y'], rect['w'], rect['h'])
         canvas.clipRect(skia_rect, skia.ClipOp.kIntersect, True)
 
@@ -132,3 +251,15 @@ class Renderer:
             elif color_str.lower() == 'green': return skia.ColorGREEN
         
         return skia.ColorWHITE
+
+_shared_renderer = None
+
+def shared_renderer():
+    """
+    Process-wide Renderer for measuring and headless rendering when no App
+    exists, so the typeface and font caches are built once per process.
+    """
+    global _shared_renderer
+    if _shared_renderer is None:
+        _shared_renderer = Renderer()
+    return _shared_renderer
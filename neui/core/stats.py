@@ -0,0 +1,156 @@
+import threading
+import time
+from collections import deque
+
+def percentile(sorted_values, fraction):
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+class FrameStats:
+    """
+    Rolling statistics over the last `window` rendered frames. A frame
+    whose work (events to present) takes more than 1.5x the frame budget
+    missed its display slot and counts as dropped.
+    """
+    def __init__(self, budget_ms=16.7, window=240, log_interval=None):
+        self.budget = budget_ms / 1000.0
+        self.frame_times = deque(maxlen=window)
+        self.presented = deque(maxlen=window)  # frame end timestamps
+        self.frames = 0
+        self.dropped = 0
+        # Print summary() every log_interval seconds (None: never)
+        self.log_interval = log_interval
+        self._last_log = time.perf_counter()
+
+    def record(self, frame_start, frame_end):
+        frame_time = frame_end - frame_start
+        self.frame_times.append(frame_time)
+        self.presented.append(frame_end)
+        self.frames += 1
+        if frame_time > self.budget * 1.5:
+            self.dropped += 1
+
+        if self.log_interval and frame_end - self._last_log >= self.log_interval:
+            self._last_log = frame_end
+            print(self.format())
+
+    def fps(self, now=None):
+        """
+        Frames presented during the last second.
+        """
+        now = time.perf_counter() if now is None else now
+        return sum(1 for t in self.presented if now - t <= 1.0)
+
+    def summary(self):
+        """
+        Frame time statistics in milliseconds over the rolling window, with
+        total frame and dropped-frame counts since the last reset.
+        """
+        times = sorted(self.frame_times)
+        count = len(times)
+        return {
+            'frames': self.frames,
+            'dropped': self.dropped,
+            'fps': self.fps(),
+            'mean_ms': sum(times) / count * 1000 if count else 0.0,
+            'p50_ms': percentile(times, 0.50) * 1000,
+            'p95_ms': percentile(times, 0.95) * 1000,
+            'p99_ms': percentile(times, 0.99) * 1000,
+            'max_ms': times[-1] * 1000 if count else 0.0,
+        }
+
+    def format(self):
+        s = self.summary()
+        return (f"frames {s['frames']} ({s['dropped']} dropped), {s['fps']} fps, "
+                f"mean {s['mean_ms']:.2f} ms, p50 {s['p50_ms']:.2f}, p95 {s['p95_ms']:.2f}, "
+                f"p99 {s['p99_ms']:.2f}, max {s['max_ms']:.2f}")
+
+    def reset(self):
+        self.frame_times.clear()
+        self.presented.clear()
+        self.frames = 0
+        self.dropped = 0
+
+class LatencyStats:
+    """
+    Input-to-present latency per event type ('key', 'char', 'scroll',
+    'mouse_button'): from the glfw callback that delivered the input to the
+    swap_buffers of the first frame rendered after it was dispatched.
+    Histograms count every sample since the last reset; percentiles cover
+    the last `window` samples of each type.
+    """
+    BUCKETS_MS = (4, 8, 12, 16, 20, 25, 33, 50, 66, 100, 150, 250, 500)
+
+    def __init__(self, window=1000):
+        self.window = window
+        self.samples = {}  # event type -> deque of seconds
+        self.counts = {}   # event type -> count per bucket, last one is overflow
+        # Pipelined frames are presented (and recorded) on the render thread
+        self._lock = threading.Lock()
+
+    def record(self, inputs, presented):
+        """
+        inputs: [(event type, arrival time)] reflected by the frame that
+        was presented at `presented` (time.perf_counter seconds).
+        """
+        with self._lock:
+            for event_type, arrived in inputs:
+                latency = presented - arrived
+                samples = self.samples.get(event_type)
+                if samples is None:
+                    samples = self.samples[event_type] = deque(maxlen=self.window)
+                    self.counts[event_type] = [0] * (len(self.BUCKETS_MS) + 1)
+                samples.append(latency)
+
+                latency_ms = latency * 1000
+                bucket = 0
+                while bucket < len(self.BUCKETS_MS) and latency_ms > self.BUCKETS_MS[bucket]:
+                    bucket += 1
+                self.counts[event_type][bucket] += 1
+
+    def histogram(self, event_type):
+        """
+        [(upper bound ms, count)]; the last bucket's bound is None (overflow).
+        """
+        with self._lock:
+            counts = list(self.counts.get(event_type, [0] * (len(self.BUCKETS_MS) + 1)))
+        return list(zip(self.BUCKETS_MS + (None,), counts))
+
+    def summary(self):
+        """
+        Per event type: sample count since reset and latency statistics in
+        milliseconds over the rolling window.
+        """
+        with self._lock:
+            samples = {event_type: sorted(values) for event_type, values in self.samples.items()}
+            totals = {event_type: sum(counts) for event_type, counts in self.counts.items()}
+        result = {}
+        for event_type, times in samples.items():
+            count = len(times)
+            result[event_type] = {
+                'count': totals[event_type],
+                'mean_ms': sum(times) / count * 1000 if count else 0.0,
+                'p50_ms': percentile(times, 0.50) * 1000,
+                'p95_ms': percentile(times, 0.95) * 1000,
+                'p99_ms': percentile(times, 0.99) * 1000,
+                'max_ms': times[-1] * 1000 if count else 0.0,
+            }
+        return result
+
+    def format(self):
+        lines = []
+        for event_type, s in sorted(self.summary().items()):
+            lines.append(f"{event_type}: {s['count']} events, mean {s['mean_ms']:.2f} ms, "
+                         f"p50 {s['p50_ms']:.2f}, p95 {s['p95_ms']:.2f}, p99 {s['p99_ms']:.2f}, "
+                         f"max {s['max_ms']:.2f}")
+        return "\n".join(lines) or "no input recorded"
+
+    def reset(self):
+        with self._lock:
+            self.samples.clear()
+            self.counts.clear()
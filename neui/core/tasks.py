@@ -0,0 +1,173 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from .events import call_handler
+from .workers import spawn_pool
+
+class TaskCancelled(Exception):
+    pass
+
+class BackgroundTask:
+    """
+    Handle for work started with App.run_in_background. In thread mode the
+    worker function receives it as its first argument and uses it to report
+    progress and to check for cancellation:
+
+        def scan(task, folder):
+            for i, path in enumerate(paths):
+                task.check_cancelled()
+                task.report(i / len(paths), path)
+
+    Listeners always run on the UI thread.
+    """
+    def __init__(self, app):
+        self.app = app
+        self.future = None
+        self.progress = 0.0
+        self.message = None
+        self.done = False
+        self.result = None
+        self.error = None
+        self._cancel_event = threading.Event()
+        self._progress_listeners = []
+        self._done_listeners = []
+
+    # --- Worker side ---
+
+    @property
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    def check_cancelled(self):
+        """
+        Raise TaskCancelled if cancel() was called; for cooperative loops.
+        """
+        if self._cancel_event.is_set():
+            raise TaskCancelled()
+
+    def report(self, progress, message=None):
+        """
+        Report progress (0..1) from the worker. Reports coalesce: the UI
+        sees the latest one each frame.
+        """
+        self.progress = progress
+        self.message = message
+        from .app import _Identity
+        self.app.post(self._deliver_progress, key=(_Identity(self), 'progress'))
+
+    # --- UI side ---
+
+    def cancel(self):
+        self._cancel_event.set()
+        # Not started yet: it never will be
+        if self.future:
+            self.future.cancel()
+
+    def add_progress_listener(self, callback):
+        """
+        callback(progress, message) on the UI thread.
+        """
+        self._progress_listeners.append(callback)
+        return self
+
+    def add_done_listener(self, callback):
+        """
+        callback(result, error) on the UI thread. error is TaskCancelled for
+        cancelled tasks. Runs immediately if the task already finished.
+        """
+        if self.done:
+            call_handler(callback, self.result, self.error)
+        else:
+            self._done_listeners.append(callback)
+        return self
+
+    def _deliver_progress(self):
+        if self.done: return
+        for callback in self._progress_listeners:
+            call_handler(callback, self.progress, self.message)
+
+    def _finish(self, future):
+        if future.cancelled():
+            self.error = TaskCancelled()
+        else:
+            self.error = future.exception()
+            if self.error is None:
+                self.result = future.result()
+        self.done = True
+        for callback in self._done_listeners:
+            call_handler(callback, self.result, self.error)
+        self._done_listeners = []
+
+def _run_task(task, fn, args, kwargs):
+    task.check_cancelled()
+    return fn(task, *args, **kwargs)
+
+class BackgroundExecutor:
+    """
+    Thread and process pools behind App.run_in_background. Pools start on
+    first use and are shut down when the app's window closes.
+    """
+    def __init__(self, app, max_workers=4, max_processes=None):
+        self.app = app
+        self.max_workers = max_workers
+        self.max_processes = max_processes
+        self._threads = None
+        self._processes = None
+        self._lock = threading.Lock()
+        self._active = set()
+
+    def configure(self, max_workers=None, max_processes=None):
+        with self._lock:
+            if max_workers is not None and max_workers != self.max_workers:
+                self.max_workers = max_workers
+                # Running tasks on the old pool still finish
+                if self._threads:
+                    self._threads.shutdown(wait=False)
+                    self._threads = None
+            if max_processes is not None and max_processes != self.max_processes:
+                self.max_processes = max_processes
+                if self._processes:
+                    self._processes.shutdown(wait=False)
+                    self._processes = None
+
+    def _thread_pool(self):
+        with self._lock:
+            if self._threads is None:
+                self._threads = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='neui-task')
+            return self._threads
+
+    def _process_pool(self):
+        with self._lock:
+            if self._processes is None:
+                self._processes = spawn_pool(self.max_processes)
+            return self._processes
+
+    def submit(self, fn, args=(), kwargs=None, process=False):
+        task = BackgroundTask(self.app)
+        kwargs = kwargs or {}
+        if process:
+            # Runs fn(*args, **kwargs) in another process: it must be
+            # picklable and gets no task handle (no progress reports)
+            task.future = self._process_pool().submit(fn, *args, **kwargs)
+        else:
+            task.future = self._thread_pool().submit(_run_task, task, fn, args, kwargs)
+
+        self._active.add(task)
+        task.add_done_listener(lambda result, error: self._active.discard(task))
+        # Results are handed to listeners on the UI thread
+        task.future.add_done_callback(lambda future: self.app.post(task._finish, future))
+        return task
+
+    def shutdown(self):
+        """
+        Cancel every task and stop the pools without waiting; cooperative
+        workers see the cancellation on their next check.
+        """
+        for task in list(self._active):
+            task.cancel()
+        self._active.clear()
+        with self._lock:
+            for pool in (self._threads, self._processes):
+                if pool:
+                    pool.shutdown(wait=False)
+            self._threads = None
+            self._processes = None
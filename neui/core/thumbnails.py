@@ -0,0 +1,158 @@
+import hashlib
+import os
+import threading
+import time
+import skia
+from .images import decode_image
+from .workers import spawn_pool
+
+# Temp files younger than this may still be being written by a worker
+TEMP_GRACE_SECONDS = 60
+
+def default_cache_dir():
+    base = os.environ.get('NEUI_CACHE_DIR') or os.path.join(os.path.expanduser('~'), '.cache', 'neui')
+    return os.path.join(base, 'thumbnails')
+
+def generate_thumbnail(src, size, dest):
+    """
+    Runs in a worker process: decode src at size and write it to dest as PNG.
+    """
+    image = decode_image(src, size)
+    data = image.encodeToData(skia.kPNG, 100)
+    if data is None:
+        raise ValueError(f"could not encode thumbnail for {src}")
+
+    # Write atomically so readers never see a partial file
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    tmp = f"{dest}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(bytes(data))
+    os.replace(tmp, dest)
+    return dest
+
+class ThumbnailCache:
+    """
+    Content-addressed on-disk cache of downscaled images. Entries are keyed
+    by (source path, mtime, file size, target size), so an edited source
+    gets a new entry. Missing entries are generated in a process pool; the
+    directory is trimmed least-recently-used first once over max_bytes.
+    Workers are spawned: scripts that enable it need an
+    `if __name__ == "__main__":` guard.
+    """
+    def __init__(self, directory=None, max_bytes=512 * 1024 * 1024, processes=None, enabled=False):
+        self.directory = directory or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.processes = processes
+        self.enabled = enabled
+
+        self._pool = None
+        self._lock = threading.Lock()
+        self._writes_since_cleanup = 0
+        self.hits = 0
+        self.misses = 0
+
+    def configure(self, enabled=None, directory=None, max_bytes=None, processes=None):
+        if enabled is not None:
+            self.enabled = enabled
+        if directory is not None:
+            self.directory = directory
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+        if processes is not None and processes != self.processes:
+            self.processes = processes
+            self.shutdown()
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                self._pool = spawn_pool(self.processes)
+            return self._pool
+
+    def path_for(self, src, size):
+        path = os.path.abspath(src)
+        st = os.stat(path)
+        key = f"{path}|{st.st_mtime_ns}|{st.st_size}|{size[0]}x{size[1]}"
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest[:2], digest + '.png')
+
+    def lookup(self, src, size):
+        """
+        Returns the cached thumbnail path, or None.
+        """
+        dest = self.path_for(src, size)
+        try:
+            # Touch on hit: mtime doubles as the LRU timestamp
+            os.utime(dest)
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return dest
+
+    def load(self, src, size):
+        """
+        Returns a decoded thumbnail of src at size, generating the cache
+        entry in the process pool if it is missing. Blocks; call it from a
+        worker thread (ImageLoader does).
+        """
+        dest = self.lookup(src, size)
+        if dest is None:
+            dest = self._get_pool().submit(generate_thumbnail, src, size, self.path_for(src, size)).result()
+            self._note_write()
+        try:
+            return decode_image(dest)
+        except Exception:
+            # Corrupt or vanished entry: fall back to the source
+            return decode_image(src, size)
+
+    def _note_write(self):
+        with self._lock:
+            self._writes_since_cleanup += 1
+            if self._writes_since_cleanup < 64: return
+            self._writes_since_cleanup = 0
+        self.cleanup()
+
+    def cleanup(self):
+        """
+        Delete least-recently-used entries until the cache fits in max_bytes.
+        Temp files are left alone while they may still be written, and
+        deleted once they are older (their writer died).
+        """
+        entries = []
+        total = 0
+        now = time.time()
+        for dirpath, _, filenames in os.walk(self.directory):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                if name.endswith('.tmp'):
+                    if now - st.st_mtime > TEMP_GRACE_SECONDS:
+                        try:
+                            os.remove(path)
+                        except OSError:
+                            pass
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+                total += st.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes: break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+        return total
+
+    def shutdown(self):
+        with self._lock:
+            if self._pool:
+                self._pool.shutdown(wait=False)
+                self._pool = None
+
+# Global instance (disabled until configured)
+thumbnail_cache = ThumbnailCache()
@@ -0,0 +1,103 @@
+import heapq
+import itertools
+import threading
+import time
+
+class Timer:
+    """
+    Handle returned by App.set_timeout/set_interval. cancel() is O(1): the
+    entry stays in the heap and is skipped when it comes up.
+    """
+    __slots__ = ('deadline', 'interval', 'callback', 'args', 'cancelled', '_queue')
+
+    def __init__(self, deadline, interval, callback, args, queue):
+        self.deadline = deadline
+        self.interval = interval
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+        self._queue = queue
+
+    def cancel(self):
+        if not self.cancelled:
+            self.cancelled = True
+            # _queue is None once a one-shot timer has fired
+            if self._queue:
+                self._queue._note_cancelled()
+
+class TimerQueue:
+    """
+    Min-heap of timers ordered by deadline (time.perf_counter seconds).
+    Scheduling is O(log n); App.run drains due timers once per iteration
+    and sleeps until next_deadline().
+    """
+    def __init__(self):
+        self._heap = []
+        self._sequence = itertools.count() # Tie-breaker: equal deadlines fire in order
+        self._lock = threading.Lock()
+        self._cancelled = 0
+
+    def __len__(self):
+        return len(self._heap) - self._cancelled
+
+    def schedule(self, delay, callback, args=(), interval=None):
+        timer = Timer(time.perf_counter() + max(0, delay), interval, callback, args, self)
+        with self._lock:
+            heapq.heappush(self._heap, (timer.deadline, next(self._sequence), timer))
+        return timer
+
+    def _note_cancelled(self):
+        with self._lock:
+            self._cancelled += 1
+            # Drop dead entries once they make up most of the heap
+            if self._cancelled > 64 and self._cancelled * 2 > len(self._heap):
+                self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+                heapq.heapify(self._heap)
+                self._cancelled = 0
+
+    def next_deadline(self):
+        """
+        Deadline of the earliest live timer, or None.
+        """
+        with self._lock:
+            while self._heap and self._heap[0][2].cancelled:
+                heapq.heappop(self._heap)
+                self._cancelled -= 1
+            return self._heap[0][0] if self._heap else None
+
+    def run_due(self, now=None):
+        """
+        Fire every timer whose deadline has passed. Returns how many fired.
+        """
+        now = time.perf_counter() if now is None else now
+        fired = 0
+        while True:
+            with self._lock:
+                if not self._heap or self._heap[0][0] > now:
+                    break
+                _, _, timer = heapq.heappop(self._heap)
+                if timer.cancelled:
+                    self._cancelled -= 1
+                    continue
+                if timer.interval is not None:
+                    # Keep the cadence, but don't replay missed ticks in a burst
+                    timer.deadline += timer.interval
+                    if timer.deadline <= now:
+                        timer.deadline = now + timer.interval
+                    heapq.heappush(self._heap, (timer.deadline, next(self._sequence), timer))
+                else:
+                    timer._queue = None
+
+            try:
+                timer.callback(*timer.args)
+            except Exception as e:
+                print(f"Timer callback failed: {e}")
+            fired += 1
+        return fired
+
+    def clear(self):
+        with self._lock:
+            for _, _, timer in self._heap:
+                timer._queue = None
+            self._heap = []
+            self._cancelled = 0
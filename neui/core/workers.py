@@ -0,0 +1,16 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+def spawn_pool(max_workers=None, initializer=None, initargs=()):
+    """
+    ProcessPoolExecutor with spawned workers. Forking a process that holds
+    a GL context and worker threads is unsafe, so workers start fresh and
+    re-import the main module: scripts that use one need an
+    `if __name__ == "__main__":` guard.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=initializer,
+        initargs=initargs
+    )
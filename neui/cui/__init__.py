@@ -1,10 +1,30 @@
-from .button import Button
-from .card import Card
-from .toggle import Toggle
-from .slider import Slider
-from .toaster import ToastManager
-from .checkbox import Checkbox
-from .radio import Radio
-from .progress import ProgressBar
-from .drawer import Drawer
-from .dropdown import Dropdown
+import importlib
+
+# Widgets are imported on first access (cui.Button, from neui.cui import Card)
+_widgets = {
+    'Button': '.button',
+    'Card': '.card',
+    'Toggle': '.toggle',
+    'Slider': '.slider',
+    'ToastManager': '.toaster',
+    'Checkbox': '.checkbox',
+    'Radio': '.radio',
+    'ProgressBar': '.progress',
+    'Drawer': '.drawer',
+    'Dropdown': '.dropdown',
+    'Heatmap': '.heatmap',
+    'LineChart': '.linechart',
+}
+
+def __getattr__(name):
+    module = _widgets.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_widgets))
+
+__all__ = list(_widgets)
@@ -1,4 +1,5 @@
 from ..ui.box import Box
+from ..core.events import call_handler
 import skia
 
 class Button(Box):
@@ -39,7 +40,7 @@ class Button(Box):
 
     def on_click(self):
         if self.on_click_handler:
-            self.on_click_handler()
+            call_handler(self.on_click_handler)
 
     def render(self, canvas, renderer):
         # 1. Draw Background (Box logic)
@@ -1,5 +1,6 @@
 from neui.ui.box import Box
 from neui.core.renderer import Renderer
+from neui.core.events import call_handler
 import skia
 
 class Checkbox(Box):
@@ -21,7 +22,7 @@ class Checkbox(Box):
     def _toggle(self):
         self.checked = not self.checked
         if self.on_change:
-            self.on_change(self.checked)
+            call_handler(self.on_change, self.checked)
 
     def render(self, canvas, renderer):
         # Draw Box (Border/Background)
@@ -55,12 +56,12 @@ class Checkbox(Box):
         
         # Draw Checkmark if checked
         if self.checked:
-            self._draw_checkmark(canvas)
+            self._draw_checkmark(canvas, renderer)
             
         # Restore style (optional, but good for consistency if user changes it)
         # self.style['bg'] = original_bg
         
-    def _draw_checkmark(self, canvas):
+    def _draw_checkmark(self, canvas, renderer):
         # Simple checkmark path
         path = skia.Path()
         x = self.computed_bounds['x']
@@ -81,4 +82,4 @@ class Checkbox(Box):
             AntiAlias=True,
             StrokeCap=skia.Paint.kRound_Cap
         )
-        canvas.drawPath(path, paint)
+        renderer.draw_path(canvas, path, paint)
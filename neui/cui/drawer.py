@@ -1,5 +1,6 @@
 from neui.ui.box import Box
 from neui.core.animation import Easing
+from neui.core.events import call_handler
 
 class Drawer(Box):
     def __init__(self, width=300, on_close=None, **kwargs):
@@ -57,7 +58,7 @@ class Drawer(Box):
         
     def _remove_self(self):
         if self.on_close_callback:
-            self.on_close_callback()
+            call_handler(self.on_close_callback)
             
     def add_content(self, element):
         self.panel.add(element)
@@ -2,6 +2,7 @@ from ..ui.element import Element
 from ..ui.box import Box
 from ..ui.text import Text
 from ..core.app import App
+from ..core.events import call_handler
 
 class Dropdown(Element):
     def __init__(self, options, value=None, on_change=None, **kwargs):
@@ -100,9 +101,10 @@ class Dropdown(Element):
             'border_width': 1
         })
         
-        # Prevent clicks on menu from closing overlay
-        def no_op(): pass
-        menu.on_click = no_op
+        # One delegated listener serves every option (and keeps clicks on
+        # the menu from reaching the overlay)
+        for event_type in ('click', 'mouse_enter', 'mouse_leave'):
+            menu.add_event_listener(event_type, self._on_menu_event)
         
         # Add Options
         for opt in self.options:
@@ -122,35 +124,27 @@ class Dropdown(Element):
             t = Text(str(opt), style={'color': self.style['color'], 'font_size': 14})
             item.add(t)
             
-            # Hover effect for item
-            # We need to attach event handlers. 
-            # Python loop variable capture fix:
-            def make_handler(option_value, item_box):
-                def on_select():
-                    self.value = option_value
-                    if self.on_change:
-                        self.on_change(option_value)
-                    self.close()
-                
-                def on_enter():
-                    item_box.style['bg'] = '#1F6FEB' # Blue highlight
-                
-                def on_leave():
-                    item_box.style['bg'] = self.style['bg']
-                    
-                return on_select, on_enter, on_leave
-
-            select_handler, enter_handler, leave_handler = make_handler(opt, item)
-            
-            item.on_click = select_handler
-            item.on_mouse_enter = enter_handler
-            item.on_mouse_leave = leave_handler
-            
             menu.add(item)
             
         self.overlay.add(menu)
         app.add_overlay(self.overlay)
 
+    def _on_menu_event(self, event):
+        item = event.child # Option box the event happened in, if any
+        if event.type == 'click':
+            event.stop_propagation()
+            if item is not None:
+                self.select(self.options[event.index])
+        elif item is not None:
+            # Hover effect for item
+            item.style['bg'] = '#1F6FEB' if event.type == 'mouse_enter' else self.style['bg']
+
+    def select(self, option):
+        self.value = option
+        if self.on_change:
+            call_handler(self.on_change, option)
+        self.close()
+
     def close(self):
         if not self.is_open: return
         
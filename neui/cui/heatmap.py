@@ -0,0 +1,208 @@
+import skia
+from ..ui.element import Element
+from ..core.pipeline import frames_in_flight
+from ..core.optional import require_numpy
+
+# Anchor colors, interpolated to 256-entry lookup tables
+COLORMAPS = {
+    'viridis': ['#440154', '#482878', '#3E4A89', '#31688E', '#26828E', '#1F9E89', '#35B779', '#6DCD59', '#B4DE2C', '#FDE725'],
+    'magma': ['#000004', '#1C1044', '#4F127B', '#812581', '#B5367A', '#E55064', '#FB8761', '#FEC287', '#FCFDBF'],
+    'inferno': ['#000004', '#1F0C48', '#550F6D', '#88226A', '#BA3655', '#E35933', '#F98C0A', '#F9C932', '#FCFFA4'],
+    'coolwarm': ['#3B4CC0', '#8DB0FE', '#DDDDDD', '#F49A7B', '#B40426'],
+    'gray': ['#000000', '#FFFFFF'],
+}
+
+def _numpy():
+    return require_numpy('Heatmap')
+
+def make_lut(cmap):
+    """
+    Builds a (256, 4) uint8 RGBA lookup table from a colormap name, a list
+    of hex colors, or an existing (N, 3|4) array.
+    """
+    np = _numpy()
+    if isinstance(cmap, str):
+        cmap = COLORMAPS[cmap]
+
+    if isinstance(cmap, (list, tuple)) and cmap and isinstance(cmap[0], str):
+        anchors = []
+        for color in cmap:
+            hex_color = color.lstrip('#')
+            anchors.append([int(hex_color[i:i + 2], 16) for i in (0, 2, 4)] + [255])
+        anchors = np.array(anchors, dtype=np.float64)
+    else:
+        anchors = np.asarray(cmap, dtype=np.float64)
+        if anchors.shape[1] == 3:
+            anchors = np.concatenate([anchors, np.full((len(anchors), 1), 255.0)], axis=1)
+
+    positions = np.linspace(0, 1, len(anchors))
+    steps = np.linspace(0, 1, 256)
+    lut = np.empty((256, 4), dtype=np.uint8)
+    for channel in range(4):
+        lut[:, channel] = np.round(np.interp(steps, positions, anchors[:, channel]))
+    return lut
+
+class _Tile:
+    __slots__ = ('r0', 'r1', 'c0', 'c1', 'br0', 'bc0', 'pixels', 'image', 'source', 'dirty')
+
+class Heatmap(Element):
+    """
+    Displays a 2D NumPy array through a colormap.
+
+    Values are mapped to colors with a vectorized lookup-table index into an
+    RGBA buffer that skia draws directly. The buffer is split into tiles, so
+    update() of a sub-rectangle only recolors and re-uploads the tiles it
+    touches.
+
+    skia's images don't own those buffers, and frames still in flight may
+    read them, so a drawn tile is recolored into a copy and the old buffer
+    is kept until those frames are done.
+    """
+    def __init__(self, data, cmap='viridis', vmin=None, vmax=None, sampling='nearest', tile_size=256, **kwargs):
+        # Copy: the caller's dict may be shared with other elements
+        style = dict(kwargs.get('style') or {})
+        if 'sampling' not in style: style['sampling'] = sampling
+        kwargs['style'] = style
+        super().__init__(**kwargs)
+
+        self.tile_size = tile_size
+        self.lut = make_lut(cmap)
+        self.tiles = []
+        # Renders so far, and (render count, pixels) of buffers that frames
+        # up to that render may still read
+        self._frames = 0
+        self._retired = []
+        self.set_data(data, vmin, vmax)
+
+    def set_data(self, data, vmin=None, vmax=None):
+        """
+        Replace the whole array. vmin/vmax default to the data's range.
+        """
+        np = _numpy()
+        self.data = np.array(data, dtype=np.float32, copy=True)
+        if self.data.ndim != 2:
+            raise ValueError("Heatmap data must be 2D")
+        self.vmin = float(np.nanmin(self.data)) if vmin is None else vmin
+        self.vmax = float(np.nanmax(self.data)) if vmax is None else vmax
+        self._build_tiles()
+        self._recolor(0, 0, *self.data.shape)
+
+    def set_range(self, vmin, vmax):
+        self.vmin, self.vmax = vmin, vmax
+        self._recolor(0, 0, *self.data.shape)
+
+    def set_colormap(self, cmap):
+        self.lut = make_lut(cmap)
+        self._recolor(0, 0, *self.data.shape)
+
+    def update(self, values, row=0, col=0):
+        """
+        Overwrite data[row:row+h, col:col+w] with values and recolor only
+        that region. The value range is kept as is.
+        """
+        np = _numpy()
+        values = np.asarray(values, dtype=np.float32)
+        h, w = values.shape
+        self.data[row:row + h, col:col + w] = values
+        self._recolor(row, col, row + h, col + w)
+
+    def _build_tiles(self):
+        np = _numpy()
+        rows, cols = self.data.shape
+        size = self.tile_size
+        for tile in self.tiles:
+            self._retire(tile)
+        self.tiles = []
+        for r0 in range(0, rows, size):
+            for c0 in range(0, cols, size):
+                tile = _Tile()
+                tile.r0, tile.r1 = r0, min(rows, r0 + size)
+                tile.c0, tile.c1 = c0, min(cols, c0 + size)
+                # 1px apron of neighbouring data so linear sampling has no seams
+                tile.br0, tile.bc0 = max(0, r0 - 1), max(0, c0 - 1)
+                br1, bc1 = min(rows, tile.r1 + 1), min(cols, tile.c1 + 1)
+                tile.pixels = np.empty((br1 - tile.br0, bc1 - tile.bc0, 4), dtype=np.uint8)
+                tile.image = None
+                tile.source = None
+                tile.dirty = True
+                self.tiles.append(tile)
+
+    def _recolor(self, r0, c0, r1, c1):
+        np = _numpy()
+        span = self.vmax - self.vmin
+        scale = 255.0 / span if span > 0 else 0.0
+
+        for tile in self.tiles:
+            # Region of this tile's buffer (apron included) that changed
+            tr0 = max(r0, tile.br0)
+            tc0 = max(c0, tile.bc0)
+            tr1 = min(r1, tile.br0 + tile.pixels.shape[0])
+            tc1 = min(c1, tile.bc0 + tile.pixels.shape[1])
+            if tr0 >= tr1 or tc0 >= tc1: continue
+
+            block = self.data[tr0:tr1, tc0:tc1]
+            idx = np.nan_to_num((block - self.vmin) * scale, nan=0.0)
+            idx = np.clip(idx, 0, 255).astype(np.uint8)
+            if tile.source is tile.pixels:
+                # Drawn already: write a copy, in-flight frames keep the old one
+                self._retire(tile)
+                tile.pixels = tile.pixels.copy()
+            out = tile.pixels[tr0 - tile.br0:tr1 - tile.br0, tc0 - tile.bc0:tc1 - tile.bc0]
+            np.take(self.lut, idx, axis=0, out=out, mode='clip')
+            tile.dirty = True
+
+        from ..core.app import App
+        app = App.get_instance()
+        if app:
+            app.invalidate()
+
+    def _retire(self, tile):
+        if tile.source is not None:
+            self._retired.append((self._frames, tile.source))
+            tile.source = None
+
+    def _tile_image(self, tile):
+        if tile.dirty or tile.image is None:
+            # New Image = new uniqueID, so only this tile is re-uploaded
+            tile.image = skia.Image.fromarray(
+                tile.pixels,
+                colorType=skia.kRGBA_8888_ColorType,
+                alphaType=skia.kPremul_AlphaType,
+                copy=False
+            )
+            # The image reads this array's memory: keep it alive with the image
+            tile.source = tile.pixels
+            tile.dirty = False
+        return tile.image
+
+    def measure(self, parent_w, parent_h):
+        rows, cols = self.data.shape
+        w = self.style.get('w')
+        h = self.style.get('h')
+        return (w if isinstance(w, (int, float)) else cols,
+                h if isinstance(h, (int, float)) else rows)
+
+    def render(self, canvas, renderer):
+        b = self.computed_bounds
+        rows, cols = self.data.shape
+        if not rows or not cols: return
+        from ..core.app import App
+        self._frames += 1
+        if self._retired:
+            # Frames up to `frames - in_flight` have been presented
+            done = self._frames - frames_in_flight(App.get_instance())
+            self._retired = [r for r in self._retired if r[0] > done]
+        sx = b['w'] / cols
+        sy = b['h'] / rows
+
+        for tile in self.tiles:
+            image = self._tile_image(tile)
+            # Source excludes the apron; destination is the tile's cells
+            src = skia.Rect.MakeXYWH(tile.c0 - tile.bc0, tile.r0 - tile.br0, tile.c1 - tile.c0, tile.r1 - tile.r0)
+            dst = {
+                'x': b['x'] + tile.c0 * sx,
+                'y': b['y'] + tile.r0 * sy,
+                'w': (tile.c1 - tile.c0) * sx,
+                'h': (tile.r1 - tile.r0) * sy,
+            }
+            renderer.draw_image(canvas, image, dst, self.style, src=src)
@@ -0,0 +1,322 @@
+import math
+import skia
+from ..ui.element import Element
+from ..core.optional import require_numpy
+
+def _numpy():
+    return require_numpy('LineChart')
+
+class _Columns:
+    """
+    Per-pixel-column first/min/max/last of the points decimated so far.
+    """
+    def __init__(self, np, width):
+        self.first = np.full(width, np.nan)
+        self.min = np.full(width, np.nan)
+        self.max = np.full(width, np.nan)
+        self.last = np.full(width, np.nan)
+
+class Series:
+    def __init__(self, x, y, color, width, name):
+        np = _numpy()
+        x = np.asarray(x, dtype=np.float64).ravel()
+        y = np.asarray(y, dtype=np.float64).ravel()
+        if x.shape != y.shape:
+            raise ValueError("x and y must have the same length")
+
+        # Growable buffers: appends are amortized O(1)
+        capacity = max(1024, len(x) * 2)
+        self.xs = np.empty(capacity)
+        self.ys = np.empty(capacity)
+        self.xs[:len(x)] = x
+        self.ys[:len(y)] = y
+        self.count = len(x)
+
+        self.name = name
+        self.color = color
+        self.width = width
+        self.paint = None
+
+        # Decimation cache for the current view
+        self.view_key = None
+        self.columns = None
+        self.decimated_upto = 0
+        self.path = None
+        # Points run through decimation so far (rebuilds count again)
+        self.decimated_points = 0
+
+    @property
+    def x(self):
+        return self.xs[:self.count]
+
+    @property
+    def y(self):
+        return self.ys[:self.count]
+
+    def append(self, x, y):
+        np = _numpy()
+        x = np.atleast_1d(np.asarray(x, dtype=np.float64))
+        y = np.atleast_1d(np.asarray(y, dtype=np.float64))
+        needed = self.count + len(x)
+        if needed > len(self.xs):
+            capacity = max(needed, len(self.xs) * 2)
+            self.xs = np.concatenate([self.xs[:self.count], np.empty(capacity - self.count)])
+            self.ys = np.concatenate([self.ys[:self.count], np.empty(capacity - self.count)])
+        self.xs[self.count:needed] = x
+        self.ys[self.count:needed] = y
+        self.count = needed
+
+class LineChart(Element):
+    """
+    Time-series chart for large NumPy series.
+
+    Each series is reduced to first/min/max/last per pixel column of the
+    visible x range (vectorized), and drawn as one cached skia.Path, so the
+    draw cost depends on the chart's pixel width rather than on the number
+    of points. Appends only decimate the new points; pan and zoom only
+    decimate the visible slice. x values must be sorted ascending.
+
+    Without x_range the view fits the data, with headroom on the right:
+    when an append outgrows it, the range grows by FIT_GROWTH, so the
+    columns are rebuilt only each time the data grows by that factor.
+    """
+    FIT_GROWTH = 1.25
+
+    def __init__(self, x_range=None, y_range=None, follow=False, **kwargs):
+        # Copy: the caller's dict may be shared with other elements
+        style = dict(kwargs.get('style') or {})
+        if 'w' not in style: style['w'] = 400
+        if 'h' not in style: style['h'] = 200
+        if 'bg' not in style: style['bg'] = '#161B22'
+        if 'radius' not in style: style['radius'] = 6
+        kwargs['style'] = style
+        super().__init__(**kwargs)
+
+        self.series = []
+        # None: fit to the data
+        self.x_range = x_range
+        self.y_range = y_range
+        # Keep the view's right edge on the newest point as data arrives
+        self.follow = follow
+        # Auto-fit range (x_range None), grown in steps by _view_x
+        self._fit = None
+
+        self.dragging = False
+        self._drag_x = 0
+        self._drag_range = None
+
+    def add_series(self, x, y, color='#58A6FF', width=1.5, name=None):
+        self.series.append(Series(x, y, color, width, name))
+        self._changed()
+        return len(self.series) - 1
+
+    def append(self, index, x, y):
+        """
+        Append points (scalars or arrays) to a series. x must keep increasing.
+        """
+        self.series[index].append(x, y)
+        if self.follow and self.x_range:
+            x0, x1 = self.x_range
+            last = self.series[index].x[-1]
+            if last > x1:
+                # Scroll by whole pixel columns so the decimated columns can
+                # be shifted instead of recomputed
+                width = int(self.computed_bounds['w'])
+                step = (x1 - x0) / width if width > 0 else 0
+                if step > 0:
+                    shift = math.ceil((last - x1) / step) * step
+                else:
+                    shift = last - x1
+                self.x_range = (x0 + shift, x1 + shift)
+        self._changed()
+
+    def set_view(self, x0, x1):
+        self.x_range = (x0, x1)
+        self._changed()
+
+    def pan(self, dx):
+        x0, x1 = self._view_x()
+        self.set_view(x0 + dx, x1 + dx)
+
+    def zoom(self, factor, center=None):
+        x0, x1 = self._view_x()
+        if center is None: center = (x0 + x1) / 2
+        self.set_view(center - (center - x0) / factor, center + (x1 - center) / factor)
+
+    def _changed(self):
+        from ..core.app import App
+        app = App.get_instance()
+        if app:
+            app.invalidate()
+
+    def _view_x(self):
+        if self.x_range:
+            return self.x_range
+        lo = min((s.x[0] for s in self.series if s.count), default=0.0)
+        hi = max((s.x[-1] for s in self.series if s.count), default=1.0)
+        if hi <= lo:
+            return (lo, lo + 1.0)
+        fit = self._fit
+        if fit is None or fit[0] != lo or hi > fit[1]:
+            span = hi - lo
+            if fit is not None and fit[0] == lo:
+                # Outgrown by appends: leave room for the next ones
+                span = max(span, (fit[1] - lo) * self.FIT_GROWTH)
+            fit = self._fit = (lo, lo + span)
+        return fit
+
+    # --- Decimation ---
+
+    def _decimate(self, series, x0, x1, width):
+        """
+        Bring series.columns up to date for the view. Only points that were
+        not decimated yet are processed when the view is unchanged.
+        """
+        np = _numpy()
+        view_key = (x0, x1, width)
+        if series.view_key != view_key:
+            shift = self._column_shift(series.view_key, view_key)
+            if shift:
+                # Follow mode scrolled by whole columns: slide them over
+                c = series.columns
+                for column in (c.first, c.min, c.max, c.last):
+                    column[:-shift] = column[shift:]
+                    column[-shift:] = np.nan
+            else:
+                series.columns = _Columns(np, width)
+                series.decimated_upto = int(np.searchsorted(series.x, x0, 'left'))
+            series.view_key = view_key
+            series.path = None
+
+        start = series.decimated_upto
+        end = int(np.searchsorted(series.x, x1, 'right'))
+        if end <= start:
+            return
+
+        xs = series.x[start:end]
+        ys = series.y[start:end]
+        cols = np.clip(((xs - x0) * (width / (x1 - x0))).astype(np.int64), 0, width - 1)
+
+        # x is sorted, so each column is one contiguous run
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(cols)) + 1))
+        ends = np.concatenate((starts[1:], [len(cols)]))
+        run_cols = cols[starts]
+        run_min = np.minimum.reduceat(ys, starts)
+        run_max = np.maximum.reduceat(ys, starts)
+
+        c = series.columns
+        # Columns seen before (only the boundary column when appending) merge
+        fresh = np.isnan(c.first[run_cols])
+        c.first[run_cols] = np.where(fresh, ys[starts], c.first[run_cols])
+        c.min[run_cols] = np.fmin(c.min[run_cols], run_min)
+        c.max[run_cols] = np.fmax(c.max[run_cols], run_max)
+        c.last[run_cols] = ys[ends - 1]
+
+        series.decimated_upto = end
+        series.decimated_points += end - start
+        series.path = None
+
+    def _column_shift(self, old_key, new_key):
+        """
+        Number of whole columns the view moved right, if that is all that
+        changed; 0 means the columns have to be rebuilt.
+        """
+        if old_key is None: return 0
+        ox0, ox1, owidth = old_key
+        x0, x1, width = new_key
+        span = x1 - x0
+        if width != owidth or not math.isclose(span, ox1 - ox0, rel_tol=1e-9): return 0
+        columns = (x0 - ox0) / span * width
+        shift = round(columns)
+        if shift <= 0 or shift >= width or abs(columns - shift) > 1e-6: return 0
+        return shift
+
+    def _y_range(self):
+        if self.y_range:
+            return self.y_range
+        np = _numpy()
+        lo, hi = np.inf, -np.inf
+        for s in self.series:
+            if s.columns is None: continue
+            if np.all(np.isnan(s.columns.min)): continue
+            lo = min(lo, np.nanmin(s.columns.min))
+            hi = max(hi, np.nanmax(s.columns.max))
+        if not np.isfinite(lo):
+            return (0.0, 1.0)
+        pad = (hi - lo) * 0.05 or 1.0
+        return (lo - pad, hi + pad)
+
+    def _build_path(self, series, width, height, y_range):
+        np = _numpy()
+        c = series.columns
+        present = np.flatnonzero(~np.isnan(c.first))
+        path = skia.Path()
+        if not len(present):
+            return path
+
+        y0, y1 = y_range
+        sy = height / (y1 - y0) if y1 > y0 else 0.0
+
+        # first, min, max, last per column keeps the rasterized shape exact
+        px = np.repeat(present + 0.5, 4)
+        py = np.stack([c.first[present], c.min[present], c.max[present], c.last[present]], axis=1).ravel()
+        py = height - (py - y0) * sy
+
+        path.addPoly([skia.Point(x, y) for x, y in zip(px.tolist(), py.tolist())], False)
+        return path
+
+    # --- Interaction: drag to pan, scroll to zoom ---
+
+    def on_mouse_down(self, x=0, y=0):
+        self.dragging = True
+        self._drag_x = x
+        self._drag_range = self._view_x()
+
+    def on_mouse_move(self, x, y):
+        if not self.dragging: return
+        x0, x1 = self._drag_range
+        dx = (x - self._drag_x) / max(1, self.computed_bounds['w']) * (x1 - x0)
+        self.set_view(x0 - dx, x1 - dx)
+
+    def on_mouse_up(self):
+        self.dragging = False
+
+    def on_scroll(self, dx, dy):
+        self.zoom(1.2 if dy > 0 else 1 / 1.2)
+
+    # --- Rendering ---
+
+    def render(self, canvas, renderer):
+        renderer.draw_rect(canvas, self.computed_bounds, self.style)
+
+        b = self.computed_bounds
+        width, height = int(b['w']), b['h']
+        if width <= 0 or height <= 0 or not self.series: return
+
+        x0, x1 = self._view_x()
+        for series in self.series:
+            self._decimate(series, x0, x1, width)
+
+        y_range = self._y_range()
+        if y_range != getattr(self, '_last_y_range', None):
+            self._last_y_range = y_range
+            for series in self.series:
+                series.path = None
+
+        # Paths are in chart-local pixels; moving the chart doesn't rebuild them
+        renderer.save(canvas)
+        renderer.clip_rect(canvas, b)
+        renderer.translate(canvas, b['x'], b['y'])
+        for series in self.series:
+            if series.path is None:
+                series.path = self._build_path(series, width, height, y_range)
+            if series.paint is None:
+                series.paint = skia.Paint(
+                    Color=renderer._parse_color(series.color),
+                    AntiAlias=True,
+                    Style=skia.Paint.kStroke_Style,
+                    StrokeWidth=series.width,
+                    StrokeJoin=skia.Paint.kRound_Join
+                )
+            renderer.draw_path(canvas, series.path, series.paint)
+        renderer.restore(canvas)
@@ -1,5 +1,4 @@
 from neui.ui.box import Box
-import skia
 
 class ProgressBar(Box):
     def __init__(self, value=0.0, **kwargs):
@@ -18,6 +17,16 @@ class ProgressBar(Box):
     def set_value(self, value):
         self.value = max(0.0, min(1.0, value))
 
+    def track(self, task):
+        """
+        Follow a BackgroundTask (App.run_in_background): the bar shows its
+        progress and fills up when it succeeds.
+        """
+        self.set_value(task.progress)
+        task.add_progress_listener(lambda progress, message: self.set_value(progress))
+        task.add_done_listener(lambda result, error: self.set_value(1.0) if error is None else None)
+        return task
+
     def render(self, canvas, renderer):
         # Draw Track
         super().render(canvas, renderer)
@@ -32,17 +41,10 @@ class ProgressBar(Box):
             
             fill_w = w * self.value
             
-            fill_rect = skia.Rect.MakeXYWH(x, y, fill_w, h)
-            paint = skia.Paint(
-                Color=renderer._parse_color(self.fill_color), 
-                AntiAlias=True
-            )
+            fill_rect = {'x': x, 'y': y, 'w': fill_w, 'h': h}
             
-            if radius > 0:
-                # We might need to clip the fill to the rounded corners of the track?
-                # Or just draw a rounded rect.
-                # If fill is small, rounded rect might look weird if radius > width.
-                # Let's just draw a rounded rect with same radius.
-                canvas.drawRRect(skia.RRect.MakeRectXY(fill_rect, radius, radius), paint)
-            else:
-                canvas.drawRect(fill_rect, paint)
+            # We might need to clip the fill to the rounded corners of the track?
+            # Or just draw a rounded rect.
+            # If fill is small, rounded rect might look weird if radius > width.
+            # Let's just draw a rounded rect with same radius.
+            renderer.fill_rect(canvas, fill_rect, renderer._parse_color(self.fill_color), radius)
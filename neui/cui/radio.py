@@ -1,4 +1,5 @@
 from neui.ui.box import Box
+from neui.core.events import call_handler
 import skia
 
 class Radio(Box):
@@ -29,7 +30,7 @@ class Radio(Box):
         if not self.checked:
             self.checked = True
             if self.on_change:
-                self.on_change(self.checked)
+                call_handler(self.on_change, self.checked)
 
     def render(self, canvas, renderer):
         # Update style based on state
@@ -43,9 +44,9 @@ class Radio(Box):
         
         # Draw Inner Dot if checked
         if self.checked:
-            self._draw_dot(canvas)
+            self._draw_dot(canvas, renderer)
             
-    def _draw_dot(self, canvas):
+    def _draw_dot(self, canvas, renderer):
         x = self.computed_bounds['x']
         y = self.computed_bounds['y']
         w = self.computed_bounds['w']
@@ -53,9 +54,5 @@ class Radio(Box):
         
         # Dot size = 50% of container
         dot_size = w * 0.5
-        offset = (w - dot_size) / 2
         
-        rect = skia.Rect.MakeXYWH(x + offset, y + offset, dot_size, dot_size)
-        paint = skia.Paint(Color=skia.Color(0, 122, 204), AntiAlias=True) # #007ACC
-        
-        canvas.drawOval(rect, paint)
+        renderer.fill_circle(canvas, x + w / 2, y + h / 2, dot_size / 2, skia.Color(0, 122, 204)) # #007ACC
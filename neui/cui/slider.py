@@ -1,5 +1,5 @@
 from ..ui.element import Element
-import skia
+from ..core.events import call_handler
 
 class Slider(Element):
     def __init__(self, value=0.5, min_val=0.0, max_val=1.0, on_change=None, **kwargs):
@@ -40,29 +40,26 @@ class Slider(Element):
         self.value = new_value
         
         if self.on_change:
-            self.on_change(self.value)
+            call_handler(self.on_change, self.value)
 
     def render(self, canvas, renderer):
         b = self.computed_bounds
         cy = b['y'] + b['h'] / 2
         
         # 1. Draw Track Background
-        track_paint = skia.Paint(Color=renderer._parse_color(self.style['track_color']), AntiAlias=True)
         # 4px height track
-        track_rect = skia.Rect.MakeXYWH(b['x'], cy - 2, b['w'], 4)
-        canvas.drawRRect(skia.RRect.MakeRectXY(track_rect, 2, 2), track_paint)
+        track_rect = {'x': b['x'], 'y': cy - 2, 'w': b['w'], 'h': 4}
+        renderer.fill_rect(canvas, track_rect, renderer._parse_color(self.style['track_color']), radius=2)
         
         # 2. Draw Active Track
         ratio = (self.value - self.min_val) / (self.max_val - self.min_val)
         active_w = b['w'] * ratio
         
-        active_paint = skia.Paint(Color=renderer._parse_color(self.style['active_color']), AntiAlias=True)
-        active_rect = skia.Rect.MakeXYWH(b['x'], cy - 2, active_w, 4)
-        canvas.drawRRect(skia.RRect.MakeRectXY(active_rect, 2, 2), active_paint)
+        active_rect = {'x': b['x'], 'y': cy - 2, 'w': active_w, 'h': 4}
+        renderer.fill_rect(canvas, active_rect, renderer._parse_color(self.style['active_color']), radius=2)
         
         # 3. Draw Thumb
         thumb_x = b['x'] + active_w
         thumb_radius = 8
-        thumb_paint = skia.Paint(Color=renderer._parse_color(self.style['thumb_color']), AntiAlias=True)
         # Add shadow to thumb?
-        canvas.drawCircle(thumb_x, cy, thumb_radius, thumb_paint)
+        renderer.fill_circle(canvas, thumb_x, cy, thumb_radius, renderer._parse_color(self.style['thumb_color']))
@@ -1,16 +1,20 @@
+import warnings
 from neui.ui.box import Box
 from neui.ui.text import Text
 from neui.core.animation import animation_manager, Animation, Easing
-import time
+from neui.core.app import App
 
 class Toast(Box):
     def __init__(self, message, duration=3.0, **kwargs):
         super().__init__(**kwargs)
         self.message = message
         self.duration = duration
-        self.start_time = time.time()
         self.is_dying = False
         
+        # Fade out after duration (an App timer, not a per-frame time check)
+        app = App.get_instance()
+        self.dismiss_timer = app.set_timeout(duration, self.dismiss) if app else None
+        
         # Default Style
         if 'bg' not in self.style: self.style['bg'] = '#333'
         if 'radius' not in self.style: self.style['radius'] = 5
@@ -25,17 +29,30 @@ class Toast(Box):
         # Content
         self.add(Text(message, style={'color': 'white'}))
 
-    def update(self):
-        elapsed = time.time() - self.start_time
-        if elapsed > self.duration and not self.is_dying:
-            self.is_dying = True
-            # Fade out
-            self.animate({'opacity': 0, 'y_offset': 20}, duration=0.5, on_complete=self.remove)
+    def dismiss(self):
+        if self.is_dying: return
+        self.is_dying = True
+        if self.dismiss_timer:
+            self.dismiss_timer.cancel()
+        # Fade out
+        self.animate({'opacity': 0, 'y_offset': 20}, duration=0.5, on_complete=self.close)
+
+    def on_detach(self):
+        if self.dismiss_timer:
+            self.dismiss_timer.cancel()
             
-    def remove(self):
+    def close(self):
+        # Remove right away, without the fade
         if self.parent:
             self.parent.remove_toast(self)
 
+    def remove(self, child=None):
+        # Deprecated: Toast.remove() was renamed to close(); with a child this is Element.remove
+        if child is not None:
+            return super().remove(child)
+        warnings.warn("Toast.remove() is deprecated, use Toast.close()", DeprecationWarning, stacklevel=2)
+        self.close()
+
 class ToastManager(Box):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -65,15 +82,9 @@ class ToastManager(Box):
         toast.animate({'opacity': 1, 'y_offset': 0}, duration=0.3, easing=Easing.ease_out_quad)
         
     def remove_toast(self, toast):
-        if toast in self.children:
-            self.children.remove(toast)
+        self.remove(toast)
 
     def render(self, canvas, renderer):
-        # Update toasts
-        for child in list(self.children): # Copy list as we might modify it
-            if isinstance(child, Toast):
-                child.update()
-                
         # Layout toasts (simple stacking from bottom)
         # We need to manually position them because they are in an overlay
         # and we want them to stack up from bottom-right.
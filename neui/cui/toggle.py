@@ -1,5 +1,5 @@
 from ..ui.box import Box
-import skia
+from ..core.events import call_handler
 
 class Toggle(Box):
     def __init__(self, checked=False, on_change=None, **kwargs):
@@ -20,7 +20,7 @@ class Toggle(Box):
     def on_click(self):
         self.checked = not self.checked
         if self.on_change:
-            self.on_change(self.checked)
+            call_handler(self.on_change, self.checked)
 
     @property
     def value(self):
@@ -51,5 +51,4 @@ class Toggle(Box):
             
         thumb_y = b['y'] + b['h'] / 2
         
-        thumb_paint = skia.Paint(Color=renderer._parse_color(self.style['thumb_color']), AntiAlias=True)
-        canvas.drawCircle(thumb_x, thumb_y, thumb_radius, thumb_paint)
+        renderer.fill_circle(canvas, thumb_x, thumb_y, thumb_radius, renderer._parse_color(self.style['thumb_color']))
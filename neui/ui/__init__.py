@@ -1,9 +1,28 @@
+import importlib
 from .element import Element
-from .box import Box
-from .text import Text
-from .input import Input
-from .image import Image
-from .scrollview import ScrollView
-from .area import Area
 
 class Window(Element): pass
+
+# Widgets are imported on first access (ui.Box, from neui.ui import Text)
+_widgets = {
+    'Box': '.box',
+    'Text': '.text',
+    'Input': '.input',
+    'Image': '.image',
+    'ArrayImage': '.array_image',
+    'ScrollView': '.scrollview',
+    'Area': '.area',
+}
+
+def __getattr__(name):
+    module = _widgets.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_widgets))
+
+__all__ = ['Element', 'Window'] + list(_widgets)
@@ -0,0 +1,132 @@
+import threading
+import skia
+from collections import deque
+from .element import Element
+from neui.core.pipeline import frames_in_flight
+from neui.core.optional import optional_numpy
+
+def _alloc_like(buffer):
+    numpy = optional_numpy()
+    if numpy is not None and isinstance(buffer, numpy.ndarray):
+        return numpy.empty_like(buffer)
+    return bytearray(memoryview(buffer).nbytes)
+
+class ArrayImage(Element):
+    """
+    Shows pixels straight from a NumPy array (or any buffer-protocol object)
+    without copying them. Intended for live camera/simulation frames:
+
+        view = ui.ArrayImage(np.zeros((480, 640, 4), np.uint8))
+        # producer thread
+        frame = view.back_buffer()
+        frame[...] = next_frame
+        view.swap()
+
+    The producer writes into a back buffer while the front one is on screen;
+    swap() publishes it and asks the App to repaint.
+    back_buffer() is fenced: it waits while a frame that may still be in
+    flight reads that buffer. With App(pipelined=True) up to
+    pipeline_depth + 2 frames are in flight (recording, queued, presenting);
+    use buffer_count=pipeline_depth + 3 so the producer doesn't wait on them.
+    """
+    def __init__(self, buffer, width=None, height=None, buffer_count=2,
+                 color_type=skia.kRGBA_8888_ColorType, alpha_type=skia.kPremul_AlphaType, **kwargs):
+        super().__init__(**kwargs)
+
+        # NumPy arrays carry their shape; raw buffers need width/height
+        shape = getattr(buffer, 'shape', None)
+        if width is None or height is None:
+            if not shape or len(shape) < 2:
+                raise ValueError("ArrayImage needs width and height for buffers without a shape")
+            height, width = shape[0], shape[1]
+        self.width = width
+        self.height = height
+        self.color_type = color_type
+        self.alpha_type = alpha_type
+
+        self.buffers = [buffer] + [_alloc_like(buffer) for _ in range(max(1, buffer_count) - 1)]
+        self._front = 0
+        self._lock = threading.Condition()
+        # Buffer indices drawn by the frames that may still be reading them
+        self._held = deque()
+        self.image = self._wrap(buffer)
+        self.frames_published = 0
+
+    def _wrap(self, buffer):
+        # Zero-copy: the skia.Image reads the buffer's memory directly
+        if hasattr(buffer, '__array_interface__'):
+            return skia.Image.fromarray(
+                buffer,
+                colorType=self.color_type,
+                alphaType=self.alpha_type,
+                copy=False
+            )
+        info = skia.ImageInfo.Make(self.width, self.height, self.color_type, self.alpha_type)
+        return skia.Image.MakeRasterData(info, skia.Data.MakeWithoutCopy(buffer), info.minRowBytes())
+
+    def back_buffer(self, timeout=None):
+        """
+        The buffer to fill with the next frame (not currently displayed).
+        Waits until no frame in flight reads it; returns None if `timeout`
+        seconds pass first.
+        """
+        with self._lock:
+            index = (self._front + 1) % len(self.buffers)
+            if index in self._held:
+                # A repaint with the current front buffer retires the old frame
+                self._invalidate()
+                if not self._lock.wait_for(lambda: index not in self._held, timeout):
+                    return None
+            return self.buffers[index]
+
+    def swap(self):
+        """
+        Publish the back buffer. Safe to call from a producer thread.
+        """
+        with self._lock:
+            self._front = (self._front + 1) % len(self.buffers)
+            # A new Image per frame gets a new uniqueID, so GPU backends
+            # re-upload it instead of drawing a stale cached texture
+            self.image = self._wrap(self.buffers[self._front])
+            self.frames_published += 1
+        self._invalidate()
+
+    def update(self, buffer):
+        """
+        Show a different buffer (same size and format) as the front buffer.
+        """
+        with self._lock:
+            self.buffers[self._front] = buffer
+            self.image = self._wrap(buffer)
+            self.frames_published += 1
+        self._invalidate()
+
+    def on_detach(self):
+        # Nothing will draw (or release) the held buffers anymore
+        with self._lock:
+            self._held.clear()
+            self._lock.notify_all()
+
+    def _invalidate(self):
+        from neui.core.app import App
+        app = App.get_instance()
+        if app:
+            app.invalidate()
+
+    def measure(self, parent_w, parent_h):
+        w = self.style.get('w')
+        h = self.style.get('h')
+        return (w if isinstance(w, (int, float)) else self.width,
+                h if isinstance(h, (int, float)) else self.height)
+
+    def render(self, canvas, renderer):
+        from neui.core.app import App
+        in_flight = frames_in_flight(App.get_instance())
+        with self._lock:
+            image = self.image
+            self._held.append(self._front)
+            while len(self._held) > in_flight:
+                self._held.popleft()
+            self._lock.notify_all()
+        if image:
+            renderer.draw_image(canvas, image, self.computed_bounds, self.style)
@@ -1,4 +1,13 @@
+from neui.core.layout import touch_layout
+
 class Element:
+    # (event type, capture) -> [listener]; created on first add_event_listener
+    _event_listeners = None
+    # Bounds the last layout pass placed this element at
+    _placed = None
+    # Position in parent.children, kept up to date by add/remove
+    _index = -1
+
     def __init__(self, **kwargs):
         self.children = []
         self.parent = None
@@ -23,9 +32,51 @@ class Element:
 
     def add(self, child):
         child.parent = self
+        child._index = len(self.children)
         self.children.append(child)
+        touch_layout()
         return child # Return child for chaining
 
+    def remove(self, child):
+        if child in self.children:
+            children = self.children
+            index = child._index
+            if index >= len(children) or children[index] is not child:
+                # Also added to another parent since: _index is for that one
+                index = children.index(child)
+            del children[index]
+            for i in range(index, len(children)):
+                children[i]._index = i
+            child._index = -1
+            child.parent = None
+            child._detach()
+            touch_layout()
+
+    def _detach(self):
+        # Let the removed subtree release resources (e.g. pending image decodes)
+        for child in self.children:
+            child._detach()
+        handler = getattr(self, 'on_detach', None)
+        if handler:
+            handler()
+
+    def add_event_listener(self, type, listener, capture=False):
+        """
+        Call listener(event) for `type` events ('click', 'mouse_enter',
+        'right_click', 'keydown', ...) on this element or any descendant.
+        Capture listeners run on the way down to the target, the others
+        on the way back up; either can call event.stop_propagation().
+        """
+        if self._event_listeners is None:
+            self._event_listeners = {}
+        self._event_listeners.setdefault((type, capture), []).append(listener)
+        return listener
+
+    def remove_event_listener(self, type, listener, capture=False):
+        listeners = (self._event_listeners or {}).get((type, capture))
+        if listeners and listener in listeners:
+            listeners.remove(listener)
+
     def render(self, canvas, renderer):
         # Base render: draw children
         # Subclasses should call super().render() or handle children manually
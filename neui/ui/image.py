@@ -1,19 +1,118 @@
-import skia
+import math
+import weakref
 from .element import Element
+from ..core.images import image_cache, image_loader, decode_image
 
 class Image(Element):
-    def __init__(self, src, **kwargs):
+    def __init__(self, src, async_decode=True, placeholder='#2D333B', placeholder_size=None, **kwargs):
         super().__init__(**kwargs)
         self.src = src
         self.image = None
-        self._load_image()
+        self.error = None
+
+        # Drawn (as a bg color) until the decode finishes
+        self.placeholder = placeholder
+        # (w, h) used for layout while loading if the style doesn't set w/h
+        self.placeholder_size = placeholder_size
+
+        self.async_decode = async_decode
+        self._request = None
+        self._cache_key = None
+        self._cache_ref = None
+        self._requested_size = None
+
+        # With both w and h declared the image is decoded at display size;
+        # otherwise it shows (and measures) at its natural size.
+        self._sized = 'w' in self.style and 'h' in self.style
+        w, h = self.style.get('w'), self.style.get('h')
+        if not self._sized:
+            self._load_image()
+        elif isinstance(w, (int, float)) and isinstance(h, (int, float)):
+            self._load_image(self._target_size(w, h))
+        # else: percentage sizes, wait for layout (see render)
+
+    @staticmethod
+    def _target_size(w, h):
+        # Round up to 16px steps so small size changes reuse the same decode
+        step = 16
+        return (max(step, math.ceil(w / step) * step), max(step, math.ceil(h / step) * step))
+
+    def _load_image(self, size=None):
+        try:
+            key = image_cache.make_key(self.src, size)
+        except OSError as e:
+            self._on_loaded(None, e)
+            return
+        
+        # A newer size supersedes a decode still in flight
+        if self._request:
+            self._request.cancel()
+            self._request = None
+        self._cache_key = key
+        self._requested_size = size
+
+        # Shared decoded copy (e.g. the same icon in 500 rows)
+        image = image_cache.acquire(key)
+        if image is not None:
+            self._on_loaded(image, None)
+            return
+
+        if self.async_decode:
+            self._request = image_loader.load(key, self._on_loaded)
+            return
 
-    def _load_image(self):
         try:
-            self.image = skia.Image.open(self.src)
+            image = image_cache.put(key, decode_image(self.src, size))
         except Exception as e:
-            print(f"Error loading image {self.src}: {e}")
-            self.image = None
+            self._on_loaded(None, e)
+            return
+        self._on_loaded(image, None)
+
+    def _on_loaded(self, image, error):
+        self._request = None
+        if error:
+            print(f"Error loading image {self.src}: {error}")
+            self.error = error
+            return
+        
+        # Replacing an earlier decode (e.g. after a resize): release it
+        if self._cache_ref:
+            self._cache_ref()
+        self.image = image
+        self.error = None
+        # Drop our cache reference when detached or garbage collected
+        self._cache_ref = weakref.finalize(self, image_cache.release, self._cache_key)
+
+    def _check_display_size(self):
+        b = self.computed_bounds
+        if b['w'] <= 0 or b['h'] <= 0: return
+        
+        target = self._target_size(b['w'], b['h'])
+        if self._requested_size is None:
+            if self._request is None:
+                self._load_image(target)
+            return
+        
+        # Regenerate only when the size changed a lot
+        rw, rh = self._requested_size
+        ratio = max(target[0] / rw, target[1] / rh)
+        if ratio > 1.25 or ratio < 0.5:
+            self._load_image(target)
+
+    def _release_image(self):
+        if self._cache_ref:
+            self._cache_ref()
+            self._cache_ref = None
+        self.image = None
+
+    def on_detach(self):
+        # Removed from the tree: stop a pending decode and let the cache
+        # evict our image once nobody else shows it
+        if self._request and image_loader.cancel_on_remove:
+            self._request.cancel()
+            self._request = None
+        self._release_image()
+        self._requested_size = None
 
     def measure(self, parent_w, parent_h):
         # Helper to resolve dim
@@ -28,15 +127,30 @@ class Image(Element):
         # If w/h are set in style, use them
         w = resolve(self.style.get('w'), parent_w)
         h = resolve(self.style.get('h'), parent_h)
-        
+
         if w is None and self.image:
             w = self.image.width()
         if h is None and self.image:
             h = self.image.height()
-            
+
+        # Still loading: hold the placeholder size
+        if self.image is None and self.placeholder_size:
+            if w is None: w = self.placeholder_size[0]
+            if h is None: h = self.placeholder_size[1]
+
         return w or 0, h or 0
 
     def render(self, canvas, renderer):
+        if self.error is None:
+            if self._sized:
+                self._check_display_size()
+            elif self.image is None and self._request is None:
+                # Re-attached after a cancelled decode: start over
+                self._load_image()
+
         if self.image:
-            # print(dir(canvas))
             renderer.draw_image(canvas, self.image, self.computed_bounds, self.style)
+            return
+
+        if self.placeholder:
+            renderer.draw_rect(canvas, self.computed_bounds, {'bg': self.placeholder, 'radius': self.style.get('radius', 0)})
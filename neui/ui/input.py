@@ -1,6 +1,5 @@
 import glfw
 import skia
-import time
 from .element import Element
 
 class Input(Element):
@@ -12,7 +11,7 @@ class Input(Element):
         self.cursor_pos = 0
         self.focused = False
         self.cursor_visible = True
-        self.last_blink_time = 0
+        self.blink_timer = None
         
         # Default styles
         if 'padding' not in self.style: self.style['padding'] = 10
@@ -23,20 +22,41 @@ class Input(Element):
     def on_focus(self):
         self.focused = True
         self.style['border'] = '2px solid #007ACC' # Visual feedback
-        # Reset blink
-        self.cursor_visible = True
-        self.last_blink_time = time.time()
+        self._restart_blink()
 
     def on_blur(self):
         self.focused = False
         if 'border' in self.style: del self.style['border']
+        self._stop_blink()
+
+    def on_detach(self):
+        self._stop_blink()
+
+    def _restart_blink(self):
+        # Cursor shows immediately, then toggles every 0.5s on an App timer
+        self.cursor_visible = True
+        self._stop_blink()
+        from neui.core.app import App
+        app = App.get_instance()
+        if app:
+            self.blink_timer = app.set_interval(0.5, self._blink)
+
+    def _stop_blink(self):
+        if self.blink_timer:
+            self.blink_timer.cancel()
+            self.blink_timer = None
+
+    def _blink(self):
+        self.cursor_visible = not self.cursor_visible
 
     def on_char(self, codepoint):
         char = chr(codepoint)
         self.text = self.text[:self.cursor_pos] + char + self.text[self.cursor_pos:]
         self.cursor_pos += 1
+        self._restart_blink()
 
     def on_keydown(self, key, mods):
+        self._restart_blink()
         if key == glfw.KEY_BACKSPACE:
             if self.cursor_pos > 0:
                 self.text = self.text[:self.cursor_pos-1] + self.text[self.cursor_pos:]
@@ -102,17 +122,12 @@ class Input(Element):
         
         renderer.draw_text(canvas, display_text, text_x, text_y, {**self.style, 'color': text_color})
 
-        # Draw Cursor
+        # Draw Cursor (blink toggled by _blink)
         if self.focused:
-            if time.time() - self.last_blink_time > 0.5:
-                self.cursor_visible = not self.cursor_visible
-                self.last_blink_time = time.time()
-            
             if self.cursor_visible:
                 cursor_text = display_text[:self.cursor_pos]
                 w, h = renderer.measure_text(cursor_text, self.style)
                 cursor_x = text_x + w
                 
-                paint = skia.Paint(Color=skia.ColorWHITE, AntiAlias=False)
                 # Cursor Y same as text Y
-                canvas.drawRect(skia.Rect.MakeXYWH(cursor_x, text_y, 2, text_h), paint)
+                renderer.fill_rect(canvas, {'x': cursor_x, 'y': text_y, 'w': 2, 'h': text_h}, skia.ColorWHITE, antialias=False)
@@ -1,7 +1,32 @@
 from .box import Box
+from neui.core.layout import touch_layout
 import skia
 
 class ScrollView(Box):
+    _scroll_x = 0
+    _scroll_y = 0
+
+    # Scrolling moves the children under the cursor without a layout change
+    @property
+    def scroll_x(self):
+        return self._scroll_x
+
+    @scroll_x.setter
+    def scroll_x(self, value):
+        if value != self._scroll_x:
+            self._scroll_x = value
+            touch_layout()
+
+    @property
+    def scroll_y(self):
+        return self._scroll_y
+
+    @scroll_y.setter
+    def scroll_y(self, value):
+        if value != self._scroll_y:
+            self._scroll_y = value
+            touch_layout()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.scroll_y = 0
@@ -92,7 +117,7 @@ class ScrollView(Box):
         renderer.clip_rect(canvas, self.computed_bounds)
         
         # 3. Translate for Scroll
-        canvas.translate(-self.scroll_x, -self.scroll_y)
+        renderer.translate(canvas, -self.scroll_x, -self.scroll_y)
         
         # 4. Render Children
         self._calculate_content_size()
@@ -4,7 +4,32 @@ class Text(Element):
     def __init__(self, text, **kwargs):
         super().__init__(**kwargs)
         self.text = text
-        self._wrapped_lines = None  # Cache wrapped lines
+        self._wrapped_lines = {}  # Cache wrapped lines, keyed by (text, width, wrap, font_size)
+
+    def _get_lines(self, max_width, renderer):
+        """
+        Cached _wrap_text. While the renderer's quality settings defer
+        re-wrapping, a width change reuses the last wrap of the same text.
+        """
+        font_size = self.style.get('font_size', 14)
+        wrap_mode = self.style.get('wrap', 'word')
+        key = (self.text, max_width, wrap_mode, font_size)
+        
+        lines = self._wrapped_lines.get(key)
+        if lines is not None:
+            return lines
+        
+        if not renderer.quality.text_rewrap:
+            for (text, _, mode, size), stale in self._wrapped_lines.items():
+                if text == self.text and mode == wrap_mode and size == font_size:
+                    return stale
+        
+        # Measure and render usually ask for one or two widths; keep it small
+        if len(self._wrapped_lines) >= 4:
+            self._wrapped_lines.clear()
+        lines = self._wrap_text(self.text, max_width, renderer)
+        self._wrapped_lines[key] = lines
+        return lines
 
     def _wrap_text(self, text, max_width, renderer):
         """
@@ -61,7 +86,7 @@ class Text(Element):
         
         if wrap_mode != 'none' and max_width > 0:
             # Wrap text
-            lines = self._wrap_text(self.text, max_width, renderer)
+            lines = self._get_lines(max_width, renderer)
             
             # Get line height
             font_size = self.style.get('font_size', 14)
@@ -78,8 +103,14 @@ class Text(Element):
         
     def measure(self, parent_w, parent_h):
         # We need a renderer instance to measure.
-        from neui.core.renderer import Renderer
-        renderer = Renderer()
+        # Prefer the app's so measuring follows its quality settings.
+        from neui.core.app import App
+        app = App.get_instance()
+        if app:
+            renderer = app.renderer
+        else:
+            from neui.core.renderer import shared_renderer
+            renderer = shared_renderer()
         
         # Check if wrapping is enabled
         wrap_mode = self.style.get('wrap', 'none')
@@ -87,7 +118,7 @@ class Text(Element):
         
         if wrap_mode != 'none' and max_width > 0:
             # Measure wrapped text
-            lines = self._wrap_text(self.text, max_width, renderer)
+            lines = self._get_lines(max_width, renderer)
             
             # Calculate total height
             font_size = self.style.get('font_size', 14)
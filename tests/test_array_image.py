@@ -0,0 +1,65 @@
+import threading
+
+import pytest
+import skia
+
+from neui.core.app import App
+from neui.core.pipeline import RenderThread
+from neui.core.renderer import Renderer
+from neui.ui.array_image import ArrayImage
+
+np = pytest.importorskip("numpy")
+
+class _PipelinedApp:
+    # Just what ArrayImage asks of the App
+    def __init__(self, render_thread, depth):
+        self._render_thread = render_thread
+        self.pipeline_depth = depth
+
+    def invalidate(self, element=None):
+        pass
+
+class _HeldRenderThread(RenderThread):
+    # Holds the frame it has taken in _present until released
+    def __init__(self, depth):
+        super().__init__(None, None, lambda context, w, h: None, depth=depth)
+        self.presenting = threading.Event()
+        self.release = threading.Event()
+
+    def _present(self, picture, width, height, on_present=None):
+        self.presenting.set()
+        self.release.wait()
+
+def _record(view, renderer):
+    recorder = skia.PictureRecorder()
+    view.render(recorder.beginRecording(skia.Rect.MakeWH(8, 8)), renderer)
+    return recorder.finishRecordingAsPicture()
+
+def test_back_buffer_waits_for_frame_being_presented(monkeypatch):
+    depth = 1
+    thread = _HeldRenderThread(depth)
+    monkeypatch.setattr(App, '_instance', _PipelinedApp(thread, depth))
+    thread.start()
+    try:
+        view = ArrayImage(np.zeros((8, 8, 4), np.uint8), buffer_count=3)
+        renderer = Renderer()
+
+        # Frame 1 shows buffer 0; the render thread takes it and stays in _present
+        thread.submit(_record(view, renderer), 8, 8)
+        assert thread.presenting.wait(5)
+        # Frame 2 (buffer 1) waits in the queue, frame 3 (buffer 2) is being recorded
+        view.swap()
+        thread.submit(_record(view, renderer), 8, 8)
+        view.swap()
+        _record(view, renderer)
+
+        # The next back buffer is buffer 0, which _present is still reading
+        assert view.back_buffer(timeout=0.2) is None
+
+        # Once frame 1 is presented and another frame is recorded, it is free
+        thread.release.set()
+        _record(view, renderer)
+        assert view.back_buffer(timeout=0.2) is view.buffers[0]
+    finally:
+        thread.release.set()
+        thread.stop()
@@ -0,0 +1,38 @@
+import pytest
+
+from neui.cui.linechart import LineChart
+
+np = pytest.importorskip("numpy")
+
+def _render(chart):
+    chart.computed_bounds = {'x': 0, 'y': 0, 'w': 400, 'h': 200}
+    for series in chart.series:
+        chart._decimate(series, *chart._view_x(), 400)
+
+def _decimated_per_append(chart, appends=200):
+    x = float(chart.series[0].x[-1])
+    counts = []
+    for _ in range(appends):
+        x += 1.0
+        before = chart.series[0].decimated_points
+        chart.append(0, x, 0.5)
+        _render(chart)
+        counts.append(chart.series[0].decimated_points - before)
+    return counts
+
+def test_follow_appends_decimate_only_new_points():
+    chart = LineChart(x_range=(0, 10_000), follow=True)
+    chart.add_series(np.arange(10_000, dtype=np.float64), np.zeros(10_000))
+    _render(chart)
+    assert max(_decimated_per_append(chart)) <= 1
+
+def test_auto_fit_appends_rebuild_rarely():
+    chart = LineChart()
+    chart.add_series(np.arange(10_000, dtype=np.float64), np.zeros(10_000))
+    _render(chart)
+    counts = _decimated_per_append(chart)
+    # The fitted range grew once (by FIT_GROWTH) and every other append
+    # only decimated its own point
+    rebuilds = [c for c in counts if c > 1]
+    assert len(rebuilds) == 1
+    assert counts.count(1) == len(counts) - 1